@@ -1,12 +1,18 @@
 """
 Setup script for tfgitsec package
 """
+import sys
 from setuptools import setup, find_packages
 from pathlib import Path
 
-# Read the README file
+# Only read the README for commands that actually publish the long description
 this_directory = Path(__file__).parent
-long_description = (this_directory / "README.md").read_text() if (this_directory / "README.md").exists() else ""
+long_description = ""
+if any(command in sys.argv for command in ("sdist", "bdist_wheel", "bdist", "dist_info")):
+    try:
+        long_description = (this_directory / "README.md").read_text(encoding="utf-8")
+    except FileNotFoundError:
+        pass
 
 setup(
     name="tfgitsec",
@@ -17,7 +23,7 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/tfgitsec",
-    packages=find_packages(),
+    packages=find_packages(include=["tfgitsec", "tfgitsec.*"], exclude=["tests", "tests.*", "build*", "dist*"]),
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -43,7 +49,13 @@ setup(
             "black>=21.0",
             "isort>=5.0",
             "mypy>=0.910",
-        ]
+        ],
+        "fast": [
+            "orjson>=3.0",
+        ],
+        "stream": [
+            "ijson>=3.0",
+        ],
     },
     entry_points={
         "console_scripts": [
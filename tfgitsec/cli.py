@@ -3,22 +3,21 @@ Command-line interface for tfgitsec
 """
 import argparse
 import sys
-import json
 import os
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from . import __version__
-from .manager import IssueManager, IssueManagerError
-from .github_client import GitHubClient, GitHubAPIError
-from .parser import TfSecParser, TfSecParseError
 
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create command-line argument parser"""
-    parser = argparse.ArgumentParser(
-        description="TfGitSec - Generate GitHub security issues from TfSec scan results",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+_SEVERITY_ORDER = ('CRITICAL', 'HIGH', 'MEDIUM', 'LOW')
+_SEVERITY_ICONS = {'CRITICAL': '🔴', 'HIGH': '🟠', 'MEDIUM': '🟡', 'LOW': '🔵'}
+
+# Used by --cache
+_DEFAULT_CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'tfgitsec')
+
+DESCRIPTION = "TfGitSec - Generate GitHub security issues from TfSec scan results"
+
+EPILOG = """
 Examples:
   # Basic usage with environment variables
   tfgitsec scan results.json
@@ -38,6 +37,9 @@ Examples:
   # Don't auto-close resolved issues
   tfgitsec scan results.json --github-repo "myorg/myrepo" --no-auto-close
 
+  # Skip re-downloading unchanged issue listings on repeated scans
+  tfgitsec scan results.json --github-repo "myorg/myrepo" --cache
+
   # Just get scan summary without creating issues
   tfgitsec summary results.json
 
@@ -53,15 +55,21 @@ Environment Variables:
   GHE_BASE_URL       - GitHub Enterprise base URL (optional)
   TFGITSEC_DEBUG     - Enable debug output (1, true, yes)
         """
-    )
-    
-    # Add version argument
-    parser.add_argument('--version', action='version', version=f'tfgitsec {__version__}')
-    
-    subparsers = parser.add_subparsers(dest='command', help='Available commands')
-    
-    # Scan command
-    scan_parser = subparsers.add_parser('scan', help='Process TfSec results and manage GitHub issues')
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for options that take a count of at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {value!r}")
+    return number
+
+
+def add_scan_arguments(scan_parser: argparse.ArgumentParser) -> None:
+    """Add arguments for the scan command"""
     scan_parser.add_argument('tfsec_file', help='Path to TfSec JSON results file')
     scan_parser.add_argument('--token', help='GitHub personal access token (or set GITHUB_TOKEN)')
     scan_parser.add_argument('--github-repo', help='GitHub repository in owner/repo format (or set GITHUB_REPO)')
@@ -80,17 +88,28 @@ Environment Variables:
                            help='Prefix to add to unique IDs for environment isolation (e.g., "production-east2")')
     scan_parser.add_argument('--security-advisory', action='store_true',
                            help='Create GitHub Security Advisories instead of regular issues (provides better security visibility)')
+    scan_parser.add_argument('--no-graphql', action='store_true',
+                           help='List, close and reopen issues with the REST API instead of GraphQL')
+    scan_parser.add_argument('--cache', action='store_true',
+                           help='Keep ETags between runs so unchanged issue listings are not re-downloaded '
+                                f'(stored in {_DEFAULT_CACHE_DIR})')
+    scan_parser.add_argument('--cache-dir', metavar='DIR',
+                           help='Like --cache, but store the cache in DIR')
+    scan_parser.add_argument('--max-workers', type=_positive_int, default=1, metavar='N',
+                           help='Create, reopen and close up to N issues at once (default: 1)')
     scan_parser.add_argument('--debug', '-d', action='store_true',
                            help='Enable debug output for troubleshooting connection issues')
-    
-    # Summary command 
-    summary_parser = subparsers.add_parser('summary', help='Generate scan summary without managing issues')
+
+
+def add_summary_arguments(summary_parser: argparse.ArgumentParser) -> None:
+    """Add arguments for the summary command"""
     summary_parser.add_argument('tfsec_file', help='Path to TfSec JSON results file')
     summary_parser.add_argument('--output', choices=['text', 'json'], default='text',
                               help='Output format (default: text)')
-    
-    # Test command
-    test_parser = subparsers.add_parser('test', help='Test GitHub API connection')
+
+
+def add_test_arguments(test_parser: argparse.ArgumentParser) -> None:
+    """Add arguments for the test command"""
     test_parser.add_argument('--token', help='GitHub personal access token (or set GITHUB_TOKEN)')
     test_parser.add_argument('--github-repo', help='GitHub repository in owner/repo format (or set GITHUB_REPO)')
     test_parser.add_argument('--ghe-base-url', help='GitHub Enterprise base URL (or set GHE_BASE_URL)')
@@ -98,47 +117,127 @@ Environment Variables:
     test_parser.add_argument('--repo', help='GitHub repository name (DEPRECATED - use --github-repo)')
     test_parser.add_argument('--debug', '-d', action='store_true',
                            help='Enable debug output for troubleshooting connection issues')
+
+
+# Subcommand name -> (help text, argument builder)
+COMMANDS = {
+    'scan': ('Process TfSec results and manage GitHub issues', add_scan_arguments),
+    'summary': ('Generate scan summary without managing issues', add_summary_arguments),
+    'test': ('Test GitHub API connection', add_test_arguments),
+}
+
+
+def create_root_parser() -> argparse.ArgumentParser:
+    """Create a minimal parser that only recognises --version and the command name
     
+    Everything after the command is collected unparsed in ``args`` for the
+    per-command parser built by build_command_parser(), so --version is only
+    honoured before the command, as with the full parser.
+    """
+    parser = argparse.ArgumentParser(prog='tfgitsec', add_help=False, allow_abbrev=False)
+    parser.add_argument('--version', action='version', version=f'tfgitsec {__version__}')
+    parser.add_argument('command', nargs='?')
+    parser.add_argument('args', nargs=argparse.REMAINDER)
+    return parser
+
+
+def build_command_parser(command: str) -> argparse.ArgumentParser:
+    """Create the argument parser for a single subcommand"""
+    help_text, add_arguments = COMMANDS[command]
+    parser = argparse.ArgumentParser(prog=f'tfgitsec {command}', description=help_text)
+    add_arguments(parser)
     return parser
 
 
+def create_parser() -> argparse.ArgumentParser:
+    """Create the full command-line argument parser
+    
+    Only needed for top-level help and error reporting; normal invocations
+    go through create_root_parser() and build_command_parser().
+    """
+    parser = argparse.ArgumentParser(
+        prog='tfgitsec',
+        description=DESCRIPTION,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=EPILOG
+    )
+    
+    # Add version argument
+    parser.add_argument('--version', action='version', version=f'tfgitsec {__version__}')
+    
+    subparsers = parser.add_subparsers(dest='command', help='Available commands')
+    
+    for command, (help_text, add_arguments) in COMMANDS.items():
+        add_arguments(subparsers.add_parser(command, help=help_text))
+    
+    return parser
+
+
+def _legacy_owner_repo(legacy_owner: Optional[str], legacy_repo: Optional[str]) -> Tuple[str, str]:
+    """Compatibility shim for the deprecated --owner/--repo options
+    
+    Exits with an error if either value is missing.
+    """
+    if not (legacy_owner and legacy_repo):
+        print("Error: Repository is required. Use --github-repo 'owner/repo' or set GITHUB_REPO environment variable", file=sys.stderr)
+        sys.exit(1)
+    
+    print("Warning: --owner and --repo are deprecated. Use --github-repo 'owner/repo' instead.", file=sys.stderr)
+    return legacy_owner, legacy_repo
+
+
+# Memoized results of get_github_config(), keyed by the inputs that feed it
+_config_cache: Dict[tuple, Tuple[str, str, str, str, str]] = {}
+
+
 def get_github_config(args) -> tuple[str, str, str, str, str]:
     """Get GitHub configuration from args or environment variables
     
+    Results are memoized per combination of arguments and environment values,
+    so repeated calls in the same process skip the parsing below.
+    
     Returns:
         Tuple of (token, owner, repo, api_base_url, web_base_url)
     """
-    token = args.token or os.getenv('GITHUB_TOKEN')
+    # Snapshot each environment variable once
+    env = os.environ
+    env_token = env.get('GITHUB_TOKEN')
+    env_repo = env.get('GITHUB_REPO')
+    env_repository = env.get('GITHUB_REPOSITORY')
+    env_ghe_base_url = env.get('GHE_BASE_URL')
+    env_enterprise_url = env.get('GITHUB_ENTERPRISE_URL')
+    env_owner = env.get('GITHUB_OWNER')
     
-    # Handle new github-repo format with support for multiple environment variable names
-    github_repo = getattr(args, 'github_repo', None) or os.getenv('GITHUB_REPO') or os.getenv('GITHUB_REPOSITORY')
-    ghe_base_url = getattr(args, 'ghe_base_url', None) or os.getenv('GHE_BASE_URL') or os.getenv('GITHUB_ENTERPRISE_URL')
+    arg_token = getattr(args, 'token', None)
+    arg_github_repo = getattr(args, 'github_repo', None)
+    arg_ghe_base_url = getattr(args, 'ghe_base_url', None)
+    arg_owner = getattr(args, 'owner', None)
+    arg_repo = getattr(args, 'repo', None)
+    
+    key = (arg_token, arg_github_repo, arg_ghe_base_url, arg_owner, arg_repo,
+           env_token, env_repo, env_repository, env_ghe_base_url, env_enterprise_url, env_owner)
+    cached = _config_cache.get(key)
+    if cached is not None:
+        return cached
+    
+    token = arg_token or env_token
     
-    # Handle legacy owner/repo format with deprecation warning
-    legacy_owner = getattr(args, 'owner', None) or os.getenv('GITHUB_OWNER')
-    legacy_repo = getattr(args, 'repo', None) or os.getenv('GITHUB_REPO')
+    # Handle new github-repo format with support for multiple environment variable names
+    github_repo = arg_github_repo or env_repo or env_repository
+    ghe_base_url = arg_ghe_base_url or env_ghe_base_url or env_enterprise_url
     
     if not token:
         print("Error: GitHub token is required. Set GITHUB_TOKEN environment variable or use --token", file=sys.stderr)
         sys.exit(1)
     
     # Determine owner/repo from new or legacy format
-    owner = None
-    repo = None
-    
     if github_repo:
         if '/' not in github_repo:
             print("Error: --github-repo must be in 'owner/repo' format", file=sys.stderr)
             sys.exit(1)
         owner, repo = github_repo.split('/', 1)
-    elif legacy_owner and legacy_repo:
-        # Show deprecation warning
-        print("Warning: --owner and --repo are deprecated. Use --github-repo 'owner/repo' instead.", file=sys.stderr)
-        owner = legacy_owner
-        repo = legacy_repo
     else:
-        print("Error: Repository is required. Use --github-repo 'owner/repo' or set GITHUB_REPO environment variable", file=sys.stderr)
-        sys.exit(1)
+        owner, repo = _legacy_owner_repo(arg_owner or env_owner, arg_repo or env_repo)
     
     # Determine API and web base URLs
     if ghe_base_url:
@@ -150,43 +249,49 @@ def get_github_config(args) -> tuple[str, str, str, str, str]:
         api_base_url = "https://api.github.com"
         web_base_url = "https://github.com"
     
-    return token, owner, repo, api_base_url, web_base_url
+    config = (token, owner, repo, api_base_url, web_base_url)
+    _config_cache[key] = config
+    return config
 
 
-def print_scan_results(result: dict, output_format: str = 'text', verbose: bool = False) -> None:
-    """Print scan results in the specified format"""
-    if output_format == 'json':
-        print(json.dumps(result, indent=2))
-        return
-    
-    # Text format
-    print(f"\n🔍 TfGitSec Scan Results")
-    print(f"📅 Scan Date: {result['scan_date']}")
+def _render_json(result: dict, verbose: bool = False) -> None:
+    """Write scan results as JSON"""
+    import json
+    json.dump(result, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+def _render_text(result: dict, verbose: bool = False) -> None:
+    """Write scan results as human-readable text"""
+    # Collected and written in one go
+    parts = []
+    parts.append(f"\n🔍 TfGitSec Scan Results\n")
+    parts.append(f"📅 Scan Date: {result['scan_date']}\n")
     
     if result['dry_run']:
-        print("🧪 DRY RUN - No changes were made")
+        parts.append("🧪 DRY RUN - No changes were made\n")
     
-    print(f"📊 Total Findings: {result['total_findings']}")
+    parts.append(f"📊 Total Findings: {result['total_findings']}\n")
     
     # Summary stats
     summary = result['summary']
     mode = result.get('mode', 'issues')
     
     if mode == 'security_advisories':
-        print(f"\n📋 Action Summary:")
-        print(f"  ✅ Advisories Created: {summary.get('advisories_created', summary.get('issues_created', 0))}")
-        print(f"  🔄 Advisories Reopened: {summary.get('advisories_reopened', summary.get('issues_reopened', 0))}")
-        print(f"  ❌ Advisories Closed: {summary.get('advisories_closed', summary.get('issues_closed', 0))}")
-        print(f"  ⏸️  Advisories Unchanged: {summary.get('advisories_unchanged', summary.get('issues_unchanged', 0))}")
+        parts.append(f"\n📋 Action Summary:\n")
+        parts.append(f"  ✅ Advisories Created: {summary.get('advisories_created', summary.get('issues_created', 0))}\n")
+        parts.append(f"  🔄 Advisories Reopened: {summary.get('advisories_reopened', summary.get('issues_reopened', 0))}\n")
+        parts.append(f"  ❌ Advisories Closed: {summary.get('advisories_closed', summary.get('issues_closed', 0))}\n")
+        parts.append(f"  ⏸️  Advisories Unchanged: {summary.get('advisories_unchanged', summary.get('issues_unchanged', 0))}\n")
     else:
-        print(f"\n📋 Action Summary:")
-        print(f"  ✅ Issues Created: {summary['issues_created']}")
-        print(f"  🔄 Issues Reopened: {summary['issues_reopened']}")
-        print(f"  ❌ Issues Closed: {summary['issues_closed']}")
-        print(f"  ⏸️  Issues Unchanged: {summary['issues_unchanged']}")
+        parts.append(f"\n📋 Action Summary:\n")
+        parts.append(f"  ✅ Issues Created: {summary['issues_created']}\n")
+        parts.append(f"  🔄 Issues Reopened: {summary['issues_reopened']}\n")
+        parts.append(f"  ❌ Issues Closed: {summary['issues_closed']}\n")
+        parts.append(f"  ⏸️  Issues Unchanged: {summary['issues_unchanged']}\n")
     
     if summary['errors'] > 0:
-        print(f"  ⚠️  Errors: {summary['errors']}")
+        parts.append(f"  ⚠️  Errors: {summary['errors']}\n")
     
     # Show detailed actions if verbose or if there were actions taken
     actions = result['actions']
@@ -199,106 +304,133 @@ def print_scan_results(result: dict, output_format: str = 'text', verbose: bool
         
         if verbose or created_count > 0:
             if actions['created']:
-                print(f"\n✅ Created Security Advisories:")
+                parts.append(f"\n✅ Created Security Advisories:\n")
                 for item in actions['created']:
                     if result['dry_run']:
-                        print(f"  • {item['title']} ({item['severity']})")
+                        parts.append(f"  • {item['title']} ({item['severity']})\n")
                     else:
                         ghsa_id = item.get('ghsa_id', 'N/A')
-                        print(f"  • {item['title']} ({item['severity']}) - {ghsa_id}")
+                        parts.append(f"  • {item['title']} ({item['severity']}) - {ghsa_id}\n")
                         if 'url' in item:
-                            print(f"    {item['url']}")
+                            parts.append(f"    {item['url']}\n")
         
         if verbose or reopened_count > 0:
             if actions['reopened']:
-                print(f"\n🔄 Reopened Security Advisories:")
+                parts.append(f"\n🔄 Reopened Security Advisories:\n")
                 for item in actions['reopened']:
                     if result['dry_run']:
-                        print(f"  • {item['title']} - {item.get('ghsa_id', 'N/A')}")
+                        parts.append(f"  • {item['title']} - {item.get('ghsa_id', 'N/A')}\n")
                     else:
-                        print(f"  • {item['title']} - {item.get('ghsa_id', 'N/A')}")
+                        parts.append(f"  • {item['title']} - {item.get('ghsa_id', 'N/A')}\n")
                         if 'url' in item:
-                            print(f"    {item['url']}")
+                            parts.append(f"    {item['url']}\n")
         
         if verbose or closed_count > 0:
             if actions['closed']:
-                print(f"\n❌ Closed Security Advisories:")
+                parts.append(f"\n❌ Closed Security Advisories:\n")
                 for item in actions['closed']:
                     if result['dry_run']:
-                        print(f"  • {item['title']} - {item.get('ghsa_id', 'N/A')}")
+                        parts.append(f"  • {item['title']} - {item.get('ghsa_id', 'N/A')}\n")
                     else:
-                        print(f"  • {item['title']} - {item.get('ghsa_id', 'N/A')}")
+                        parts.append(f"  • {item['title']} - {item.get('ghsa_id', 'N/A')}\n")
                         if 'url' in item:
-                            print(f"    {item['url']}")
+                            parts.append(f"    {item['url']}\n")
     else:
         if verbose or summary['issues_created'] > 0:
             if actions['created']:
-                print(f"\n✅ Created Issues:")
+                parts.append(f"\n✅ Created Issues:\n")
                 for item in actions['created']:
                     if result['dry_run']:
-                        print(f"  • {item['title']} ({item['severity']})")
+                        parts.append(f"  • {item['title']} ({item['severity']})\n")
                     else:
-                        print(f"  • {item['title']} ({item['severity']}) - #{item['issue_number']}")
+                        parts.append(f"  • {item['title']} ({item['severity']}) - #{item['issue_number']}\n")
                         if 'url' in item:
-                            print(f"    {item['url']}")
+                            parts.append(f"    {item['url']}\n")
         
         if verbose or summary['issues_reopened'] > 0:
             if actions['reopened']:
-                print(f"\n🔄 Reopened Issues:")
+                parts.append(f"\n🔄 Reopened Issues:\n")
                 for item in actions['reopened']:
                     if result['dry_run']:
-                        print(f"  • {item['title']} - #{item['issue_number']}")
+                        parts.append(f"  • {item['title']} - #{item['issue_number']}\n")
                     else:
-                        print(f"  • {item['title']} - #{item['issue_number']}")
+                        parts.append(f"  • {item['title']} - #{item['issue_number']}\n")
                         if 'url' in item:
-                            print(f"    {item['url']}")
+                            parts.append(f"    {item['url']}\n")
         
         if verbose or summary['issues_closed'] > 0:
             if actions['closed']:
-                print(f"\n❌ Closed Issues:")
+                parts.append(f"\n❌ Closed Issues:\n")
                 for item in actions['closed']:
                     if result['dry_run']:
-                        print(f"  • {item['title']} - #{item['issue_number']}")
+                        parts.append(f"  • {item['title']} - #{item['issue_number']}\n")
                     else:
-                        print(f"  • {item['title']} - #{item['issue_number']}")
+                        parts.append(f"  • {item['title']} - #{item['issue_number']}\n")
                         if 'url' in item:
-                            print(f"    {item['url']}")
+                            parts.append(f"    {item['url']}\n")
     
     if actions['errors']:
-        print(f"\n⚠️ Errors:")
+        parts.append(f"\n⚠️ Errors:\n")
         for error in actions['errors']:
-            print(f"  • {error['action']}: {error['error']}")
+            parts.append(f"  • {error['action']}: {error['error']}\n")
     
     # Show scan statistics
     if verbose:
         stats = result['scan_stats']
-        print(f"\n📈 Scan Statistics:")
+        parts.append(f"\n📈 Scan Statistics:\n")
         
         by_severity = stats.get('by_severity', {})
         if by_severity:
-            print("  Severity Distribution:")
-            for severity in ['CRITICAL', 'HIGH', 'MEDIUM', 'LOW']:
+            parts.append("  Severity Distribution:\n")
+            for severity in _SEVERITY_ORDER:
                 count = by_severity.get(severity, 0)
                 if count > 0:
-                    print(f"    {severity}: {count}")
+                    parts.append(f"    {severity}: {count}\n")
         
         by_service = stats.get('by_service', {})
         if by_service:
-            print("  By Service:")
+            parts.append("  By Service:\n")
             for service, count in sorted(by_service.items()):
-                print(f"    {service}: {count}")
+                parts.append(f"    {service}: {count}\n")
+    
+    sys.stdout.write("".join(parts))
+
+
+# Output format -> renderer; keys match the --output choices, anything else renders as text
+_OUTPUT_RENDERERS = {
+    'text': _render_text,
+    'json': _render_json,
+}
+
+
+def print_scan_results(result: dict, output_format: str = 'text', verbose: bool = False) -> None:
+    """Print scan results in the specified format"""
+    _OUTPUT_RENDERERS.get(output_format, _render_text)(result, verbose)
+
+
+def _require_file(path: str) -> None:
+    """Exit with an error if the TfSec results file does not exist"""
+    try:
+        os.stat(path)
+    except (OSError, ValueError):
+        # ValueError: embedded NUL byte in the path
+        print(f"Error: TfSec file not found: {path}", file=sys.stderr)
+        sys.exit(1)
 
 
 def handle_scan_command(args) -> None:
     """Handle the scan command"""
     # Validate TfSec file exists
-    if not os.path.exists(args.tfsec_file):
-        print(f"Error: TfSec file not found: {args.tfsec_file}", file=sys.stderr)
-        sys.exit(1)
+    _require_file(args.tfsec_file)
     
     # Get GitHub configuration
     token, owner, repo, api_base_url, web_base_url = get_github_config(args)
     
+    # Deferred so that --help/summary never pay for importing requests
+    from .manager import IssueManager, IssueManagerError
+    from .github_client import GitHubClient, GitHubAPIError
+    from .parser import TfSecParseError
+    
     # Show configuration when debug is enabled
     debug_mode = getattr(args, 'debug', False)
     if debug_mode:
@@ -308,9 +440,13 @@ def handle_scan_command(args) -> None:
         print(f"  Web Base URL: {web_base_url}")
         print(f"  Token: {'***' if token else 'MISSING'}")
     
+    cache_dir = args.cache_dir or (_DEFAULT_CACHE_DIR if args.cache else None)
+    
+    github_client = None
     try:
         # Create GitHub client and issue manager
-        github_client = GitHubClient(token, owner, repo, api_base_url, web_base_url, debug=debug_mode)
+        github_client = GitHubClient(token, owner, repo, api_base_url, web_base_url, debug=debug_mode,
+                                     cache_dir=cache_dir)
         auto_close = not args.no_auto_close
         
         # Test connection first
@@ -322,7 +458,10 @@ def handle_scan_command(args) -> None:
         
         # Create issue manager
         use_advisories = getattr(args, 'security_advisory', False)
-        issue_manager = IssueManager(github_client, auto_close=auto_close, dry_run=args.dry_run, use_security_advisories=use_advisories)
+        issue_manager = IssueManager(github_client, auto_close=auto_close, dry_run=args.dry_run, use_security_advisories=use_advisories,
+                                     use_graphql=not args.no_graphql, max_workers=args.max_workers,
+                                     # JSON output and --verbose list unchanged issues too
+                                     verbose_actions=args.output == 'json' or args.verbose)
         
         # Process scan results
         print(f"📖 Processing TfSec results from {args.tfsec_file}...")
@@ -340,40 +479,46 @@ def handle_scan_command(args) -> None:
             import traceback
             traceback.print_exc()
         sys.exit(1)
+    finally:
+        # Saves any ETags fetched since the last listing
+        if github_client is not None:
+            github_client.close()
 
 
 def handle_summary_command(args) -> None:
     """Handle the summary command"""
     # Validate TfSec file exists
-    if not os.path.exists(args.tfsec_file):
-        print(f"Error: TfSec file not found: {args.tfsec_file}", file=sys.stderr)
-        sys.exit(1)
+    _require_file(args.tfsec_file)
+    
+    from .parser import TfSecParser, TfSecParseError
     
     try:
         # Parse findings and generate summary
-        findings = TfSecParser.parse_file(args.tfsec_file)
-        stats = TfSecParser.validate_findings(findings)
+        findings, stats = TfSecParser.parse_file(args.tfsec_file, collect_stats=True)
         
         if args.output == 'json':
-            print(json.dumps(stats, indent=2))
+            import json
+            json.dump(stats, sys.stdout, indent=2)
+            sys.stdout.write("\n")
         else:
-            print("📊 TfSec Scan Summary")
-            print(f"Total Findings: {stats['total']}")
+            parts = ["📊 TfSec Scan Summary\n", f"Total Findings: {stats['total']}\n"]
             
             by_severity = stats.get('by_severity', {})
             if by_severity:
-                print("\nBy Severity:")
-                for severity in ['CRITICAL', 'HIGH', 'MEDIUM', 'LOW']:
+                parts.append("\nBy Severity:\n")
+                for severity in _SEVERITY_ORDER:
                     count = by_severity.get(severity, 0)
                     if count > 0:
-                        icon = {'CRITICAL': '🔴', 'HIGH': '🟠', 'MEDIUM': '🟡', 'LOW': '🔵'}.get(severity, '⚫')
-                        print(f"  {icon} {severity}: {count}")
+                        icon = _SEVERITY_ICONS.get(severity, '⚫')
+                        parts.append(f"  {icon} {severity}: {count}\n")
             
             by_service = stats.get('by_service', {})
             if by_service:
-                print("\nBy Service:")
+                parts.append("\nBy Service:\n")
                 for service, count in sorted(by_service.items()):
-                    print(f"  {service}: {count}")
+                    parts.append(f"  {service}: {count}\n")
+            
+            sys.stdout.write("".join(parts))
         
     except TfSecParseError as e:
         print(f"❌ Error parsing TfSec file: {e}", file=sys.stderr)
@@ -387,6 +532,8 @@ def handle_test_command(args) -> None:
     """Handle the test command"""
     token, owner, repo, api_base_url, web_base_url = get_github_config(args)
     
+    from .github_client import GitHubClient, GitHubAPIError
+    
     try:
         debug_mode = getattr(args, 'debug', False)
         github_client = GitHubClient(token, owner, repo, api_base_url, web_base_url, debug=debug_mode)
@@ -413,12 +560,28 @@ def handle_test_command(args) -> None:
 
 def main() -> None:
     """Main CLI entry point"""
-    parser = create_parser()
-    args = parser.parse_args()
+    # Answer bare --version/--help without building any subcommand parsers
+    if len(sys.argv) == 2:
+        if sys.argv[1] in ('--version', '-V'):
+            sys.stdout.write(f"tfgitsec {__version__}\n")
+            return
+        if sys.argv[1] in ('-h', '--help'):
+            create_parser().print_help()
+            return
     
-    if not args.command:
-        parser.print_help()
-        sys.exit(1)
+    root_args, unknown = create_root_parser().parse_known_args()
+    
+    if root_args.command not in COMMANDS or unknown:
+        # No/unknown command or stray options before it: let the full parser
+        # print help or the error
+        parser = create_parser()
+        args = parser.parse_args()
+        if not args.command:
+            parser.print_help()
+            sys.exit(1)
+    else:
+        args = build_command_parser(root_args.command).parse_args(root_args.args)
+        args.command = root_args.command
     
     if args.command == 'scan':
         handle_scan_command(args)
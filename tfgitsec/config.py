@@ -1,11 +1,84 @@
 """
 Configuration management for tfgitsec
 """
+from __future__ import annotations
+
 import os
-import configparser
-from typing import Optional, Dict, Any
+from functools import cached_property
+from types import MappingProxyType
+from typing import TYPE_CHECKING
 from pathlib import Path
 
+if TYPE_CHECKING:
+    from typing import Dict, Iterable, Optional, Mapping, Tuple
+
+# User-level config locations, expanded once at import
+_USER_CONFIG_PATHS = (
+    os.path.expanduser('~/.tfgitsec.ini'),
+    os.path.expanduser('~/.config/tfgitsec/config.ini'),
+)
+
+# Default configuration locations, highest precedence first
+_DEFAULT_CONFIG_LOCATIONS = ('tfgitsec.ini', '.tfgitsec.ini', *_USER_CONFIG_PATHS)
+
+# Values accepted for boolean settings (same spellings as ConfigParser.getboolean)
+_BOOLEAN_STATES = {
+    '1': True, 'yes': True, 'true': True, 'on': True,
+    '0': False, 'no': False, 'false': False, 'off': False,
+}
+
+
+class ConfigError(ValueError):
+    """Raised when a configuration file cannot be parsed"""
+    pass
+
+
+def _parse_ini(text: str, source: str = '<string>') -> Dict[str, Dict[str, str]]:
+    """Parse the small INI dialect used by tfgitsec config files
+    
+    Supports ``[section]`` headers, ``key = value`` / ``key: value`` pairs and
+    full-line ``#`` / ``;`` comments. Keys are lower-cased and values stripped,
+    as with ConfigParser; there is no interpolation or multi-line values.
+    
+    Raises:
+        ConfigError: If a line is neither a section, a setting nor a comment
+    """
+    sections: Dict[str, Dict[str, str]] = {}
+    current: Optional[Dict[str, str]] = None
+    
+    for lineno, raw in enumerate(text.splitlines(), 1):
+        line = raw.strip()
+        if not line or line[0] in '#;':
+            continue
+        
+        if line[0] == '[' and line[-1] == ']':
+            current = sections.setdefault(line[1:-1].strip(), {})
+            continue
+        
+        sep = min((i for i in (line.find('='), line.find(':')) if i > 0), default=-1)
+        if current is None or sep < 0:
+            raise ConfigError(f"{source}, line {lineno}: cannot parse {raw!r}")
+        current[line[:sep].strip().lower()] = line[sep + 1:].strip()
+    
+    return sections
+
+
+def _read_first_ini_file(paths: Iterable[str]) -> Tuple[Dict[str, Dict[str, str]], Optional[str]]:
+    """Read the first config file in paths that can be loaded
+    
+    Files that cannot be opened, decoded or parsed are skipped and the next
+    location is tried. Settings are never merged across files. Returns the
+    sections and the path they came from, or ({}, None) if none loaded.
+    """
+    for path in paths:
+        try:
+            with open(path, encoding='utf-8') as f:
+                return _parse_ini(f.read(), path), path
+        except (OSError, UnicodeDecodeError, ConfigError):
+            continue
+    
+    return {}, None
+
 
 class Config:
     """Configuration manager for tfgitsec"""
@@ -15,38 +88,32 @@ class Config:
         
         Args:
             config_file: Path to configuration file. If None, looks for default locations
+        
+        Nothing is read from disk until a setting is first requested.
         """
-        self.config = configparser.ConfigParser()
-        self._load_config(config_file)
+        self._config_file = config_file
+        self._config: Optional[Dict[str, Dict[str, str]]] = None
+    
+    @property
+    def config(self) -> Dict[str, Dict[str, str]]:
+        """Raw settings as ``{section: {key: value}}``, loaded on first access"""
+        if self._config is None:
+            self._config = {}
+            self._load_config(self._config_file)
+        return self._config
     
     def _load_config(self, config_file: Optional[str] = None) -> None:
         """Load configuration from file or defaults"""
         
-        # Default configuration locations
-        config_locations = []
+        config_locations = (config_file, *_DEFAULT_CONFIG_LOCATIONS) if config_file else _DEFAULT_CONFIG_LOCATIONS
         
-        if config_file:
-            config_locations.append(config_file)
-        
-        # Add default locations
-        config_locations.extend([
-            'tfgitsec.ini',
-            '.tfgitsec.ini', 
-            os.path.expanduser('~/.tfgitsec.ini'),
-            os.path.expanduser('~/.config/tfgitsec/config.ini')
-        ])
-        
-        # Try to read from each location
-        for location in config_locations:
-            if os.path.exists(location):
-                try:
-                    self.config.read(location)
-                    break
-                except Exception:
-                    continue
+        # The first file that loads wins; missing files are simply skipped, so
+        # there is no need to probe each location first
+        sections, path = _read_first_ini_file(config_locations)
+        self.config.update(sections)
         
         # Set defaults if no config file was loaded
-        if not self.config.sections():
+        if path is None:
             self._set_defaults()
     
     def _set_defaults(self) -> None:
@@ -72,52 +139,108 @@ class Config:
             'low_label': 'severity-low'
         }
     
-    def get_github_token(self) -> Optional[str]:
-        """Get GitHub token from config or environment"""
+    def _get(self, section: str, key: str, fallback: Optional[str] = None) -> Optional[str]:
+        """Look up a raw setting, returning fallback if it is not set"""
+        return self.config.get(section, {}).get(key, fallback)
+    
+    def _getboolean(self, section: str, key: str, fallback: bool) -> bool:
+        """Look up a boolean setting, returning fallback if it is not set"""
+        value = self._get(section, key)
+        if value is None:
+            return fallback
+        try:
+            return _BOOLEAN_STATES[value.lower()]
+        except KeyError:
+            raise ConfigError(f"Not a boolean: {section}.{key} = {value!r}") from None
+    
+    # Settings are resolved once per Config instance and then cached
+    
+    @cached_property
+    def github_token(self) -> Optional[str]:
+        """GitHub token from config or environment"""
         return (
             os.getenv('GITHUB_TOKEN') or 
-            self.config.get('github', 'token', fallback=None)
+            self._get('github', 'token', fallback=None)
         )
     
-    def get_github_owner(self) -> Optional[str]:
-        """Get GitHub owner from config or environment"""
+    @cached_property
+    def github_owner(self) -> Optional[str]:
+        """GitHub owner from config or environment"""
         return (
             os.getenv('GITHUB_OWNER') or
-            self.config.get('github', 'owner', fallback=None)
+            self._get('github', 'owner', fallback=None)
         )
     
-    def get_github_repo(self) -> Optional[str]:
-        """Get GitHub repo from config or environment"""
+    @cached_property
+    def github_repo(self) -> Optional[str]:
+        """GitHub repo from config or environment"""
         return (
             os.getenv('GITHUB_REPO') or
-            self.config.get('github', 'repo', fallback=None)
+            self._get('github', 'repo', fallback=None)
         )
     
+    @cached_property
+    def auto_close(self) -> bool:
+        """Auto-close setting"""
+        return self._getboolean('settings', 'auto_close', fallback=True)
+    
+    @cached_property
+    def dry_run(self) -> bool:
+        """Dry-run setting"""
+        return self._getboolean('settings', 'dry_run', fallback=False)
+    
+    @cached_property
+    def output_format(self) -> str:
+        """Output format setting"""
+        return self._get('settings', 'output_format', fallback='text')
+    
+    @cached_property
+    def verbose(self) -> bool:
+        """Verbose setting"""
+        return self._getboolean('settings', 'verbose', fallback=False)
+    
+    @cached_property
+    def labels(self) -> Mapping[str, str]:
+        """Label configuration (read-only, shared between callers)"""
+        return MappingProxyType({
+            'base': self._get('labels', 'base_label', fallback='tfsec-security'),
+            'critical': self._get('labels', 'critical_label', fallback='severity-critical'),
+            'high': self._get('labels', 'high_label', fallback='severity-high'),
+            'medium': self._get('labels', 'medium_label', fallback='severity-medium'),
+            'low': self._get('labels', 'low_label', fallback='severity-low')
+        })
+    
+    def get_github_token(self) -> Optional[str]:
+        """Get GitHub token from config or environment"""
+        return self.github_token
+    
+    def get_github_owner(self) -> Optional[str]:
+        """Get GitHub owner from config or environment"""
+        return self.github_owner
+    
+    def get_github_repo(self) -> Optional[str]:
+        """Get GitHub repo from config or environment"""
+        return self.github_repo
+    
     def get_auto_close(self) -> bool:
         """Get auto-close setting"""
-        return self.config.getboolean('settings', 'auto_close', fallback=True)
+        return self.auto_close
     
     def get_dry_run(self) -> bool:
         """Get dry-run setting"""
-        return self.config.getboolean('settings', 'dry_run', fallback=False)
+        return self.dry_run
     
     def get_output_format(self) -> str:
         """Get output format setting"""
-        return self.config.get('settings', 'output_format', fallback='text')
+        return self.output_format
     
     def get_verbose(self) -> bool:
         """Get verbose setting"""
-        return self.config.getboolean('settings', 'verbose', fallback=False)
+        return self.verbose
     
-    def get_labels(self) -> Dict[str, str]:
+    def get_labels(self) -> Mapping[str, str]:
         """Get label configuration"""
-        return {
-            'base': self.config.get('labels', 'base_label', fallback='tfsec-security'),
-            'critical': self.config.get('labels', 'critical_label', fallback='severity-critical'),
-            'high': self.config.get('labels', 'high_label', fallback='severity-high'),
-            'medium': self.config.get('labels', 'medium_label', fallback='severity-medium'),
-            'low': self.config.get('labels', 'low_label', fallback='severity-low')
-        }
+        return self.labels
     
     def create_sample_config(self, path: str = 'tfgitsec.ini') -> None:
         """Create a sample configuration file"""
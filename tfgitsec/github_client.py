@@ -1,23 +1,161 @@
 """
 GitHub API client for managing security issues
 """
+from __future__ import annotations
+
 import requests
-from typing import List, Optional, Dict, Any
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ConnectTimeoutError
+from urllib3.util.retry import Retry
+from typing import TYPE_CHECKING
 from datetime import datetime
+import os
+import re
 import sys
-from urllib.parse import urlparse
+import threading
+import time
+from urllib.parse import urlparse, urlunparse, parse_qs, urlencode
+from concurrent.futures import ThreadPoolExecutor
 from .models import GitHubIssue, TfSecFinding
 
+try:
+    import orjson as _json
+    _json_dumps = _json.dumps
+except ImportError:  # orjson is an optional speedup
+    import json as _json
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return _json.dumps(obj).encode("utf-8")
+
+if TYPE_CHECKING:
+    from typing import List, Optional, Dict, Any, Iterator, Tuple, Union, Callable
+
+
+# TfSec severity -> GitHub Security Advisory severity
+_SEVERITY_MAP = {
+    "CRITICAL": "critical",
+    "HIGH": "high",
+    "MEDIUM": "medium",
+    "LOW": "low"
+}
+
+# Unique ID format used to track findings: resource[rule_id]
+_UNIQUE_ID_RE = re.compile(r"\[.+\]")
+
+# Request bodies are encoded with _json_dumps and sent with this header
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# GitHub's secondary rate limits penalise bursts of concurrent content-creating
+# requests, so POST/PATCH calls share this many slots per client
+_MAX_CONCURRENT_WRITES = 5
+
+# Secondary rate limits (429, or 403 + Retry-After or "secondary rate limit")
+# are retried this many times, backing off exponentially from this many seconds
+_SECONDARY_LIMIT_RETRIES = 3
+_SECONDARY_LIMIT_BACKOFF = 5
+
+# Pages fetched in parallel once the Link header names the last page
+_MAX_PAGE_WORKERS = 8
+
+# Bump when the on-disk ETag cache layout changes; older files are ignored
+_ETAG_CACHE_VERSION = 1
+
+# Fields needed to build a GitHubIssue from a GraphQL Issue node
+_GRAPHQL_ISSUE_FIELDS = "id number title state createdAt updatedAt body labels(first: 100) { nodes { name } }"
+
+_CLOSE_WITH_COMMENT_MUTATION = """
+mutation($id: ID!, $body: String!) {
+  addComment(input: {subjectId: $id, body: $body}) { clientMutationId }
+  closeIssue(input: {issueId: $id}) { issue { %s } }
+}
+""" % _GRAPHQL_ISSUE_FIELDS
+
+_TFSEC_ISSUES_QUERY = """
+query($owner: String!, $name: String!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    issues(first: 100, labels: ["tfsec-security"], after: $cursor) {
+      pageInfo { hasNextPage endCursor }
+      nodes { %s }
+    }
+  }
+}
+""" % _GRAPHQL_ISSUE_FIELDS
+
+_REOPEN_WITH_COMMENT_MUTATION = """
+mutation($id: ID!, $body: String!) {
+  reopenIssue(input: {issueId: $id}) { issue { %s } }
+  addComment(input: {subjectId: $id, body: $body}) { clientMutationId }
+}
+""" % _GRAPHQL_ISSUE_FIELDS
+
 
 class GitHubAPIError(Exception):
     """Raised when there's an error with the GitHub API"""
     pass
 
 
+class GraphQLUnavailableError(GitHubAPIError):
+    """Raised when a GraphQL request was refused before anything was executed"""
+    pass
+
+
+# Longest Retry-After the HTTP adapter will sleep for before retrying
+_MAX_RETRY_AFTER = 60
+
+
+class _GitHubRetry(Retry):
+    """Retry policy that never repeats a write GitHub may already have applied
+    
+    GET/HEAD are retried on transient errors. POST/PATCH are never retried on
+    a response: a 5xx or read timeout on a write may come after the issue or
+    comment was created.
+    
+    Rate limits (403/429) are left to GitHubClient._request, which can tell an
+    exhausted primary limit (not worth waiting for) from a secondary one and
+    retries either method without a concurrent-write slot held while it sleeps.
+    """
+    
+    RETRY_AFTER_STATUS_CODES = frozenset([413, 503])
+    
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, _MAX_RETRY_AFTER)
+
+
+def _retry_policy() -> Retry:
+    """Retry transient errors with exponential backoff
+    
+    Retry-After is honoured (up to _MAX_RETRY_AFTER seconds), and the final
+    response is returned rather than raised once retries run out so the
+    caller can report it. See _GitHubRetry for which writes are retried;
+    rate limits are retried by GitHubClient._request.
+    """
+    kwargs = dict(
+        total=8,
+        # Unreachable hosts and timeouts rarely recover; don't back off for minutes
+        connect=2,
+        read=2,
+        backoff_factor=1,
+        status_forcelist=(500, 502, 503, 504),
+        # Status and read retries; writes are only retried on connection errors
+        allowed_methods=frozenset(["GET", "HEAD"]),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    try:
+        return _GitHubRetry(backoff_max=60, **kwargs)
+    except TypeError:
+        # urllib3 < 2.0 has no backoff_max argument (fixed 120s cap)
+        return _GitHubRetry(**kwargs)
+
+
 class GitHubClient:
     """Client for interacting with GitHub API"""
     
-    def __init__(self, token: str, owner: str, repo: str, api_base_url: str = "https://api.github.com", web_base_url: str = "https://github.com", debug: bool = False):
+    def __init__(self, token: str, owner: str, repo: str, api_base_url: str = "https://api.github.com", web_base_url: str = "https://github.com", debug: bool = False,
+                 cache_dir: Optional[str] = None):
         """Initialize GitHub client
         
         Args:
@@ -27,6 +165,8 @@ class GitHubClient:
             api_base_url: GitHub API base URL (for GitHub Enterprise)
             web_base_url: GitHub web interface base URL (for GitHub Enterprise)
             debug: Enable debug output
+            cache_dir: Directory for persisting ETags and cached listings between runs
+                (e.g. ~/.cache/tfgitsec). Nothing is written when None.
         """
         self.token = token
         self.owner = owner
@@ -35,17 +175,45 @@ class GitHubClient:
         self.web_base_url = web_base_url
         self.debug = debug
         
+        # GraphQL lives at /graphql on github.com and /api/graphql on GitHub Enterprise
+        if api_base_url.rstrip('/').endswith("/api/v3"):
+            self.graphql_url = f"{api_base_url.rstrip('/')[:-len('/v3')]}/graphql"
+        else:
+            self.graphql_url = f"{api_base_url.rstrip('/')}/graphql"
+        
         # Keep legacy attributes for backward compatibility
         self.repo_owner = owner
         self.repo_name = repo
         self.base_url = api_base_url
         
+        # Every REST endpoint used here lives under the repository URL
+        self._repo_url_base = f"{api_base_url}/repos/{owner}/{repo}"
+        self._api_hostname = urlparse(api_base_url).hostname
+        
         self.headers = {
             "Authorization": f"token {token}",
             "Accept": "application/vnd.github.v3+json",
             "User-Agent": "tfgitsec/1.0.0"
         }
         
+        # Long-lived session so keep-alive connections are reused across requests
+        self._session = self._new_session(self.headers)
+        self._write_slots = threading.BoundedSemaphore(_MAX_CONCURRENT_WRITES)
+        
+        # Cleared once a GraphQL mutation is refused; later ones go straight to REST
+        self.graphql_available = True
+        
+        # Last tfgitsec issue listing: (time.monotonic() timestamp, issues)
+        self._tfsec_issues_cache: Optional[Tuple[float, List[GitHubIssue]]] = None
+        
+        # ETag cache for the tfgitsec issue listing: (endpoint, params) -> (etag, body, links)
+        self._etags: Dict[Tuple[str, tuple], Tuple[str, Any, Dict[str, Dict[str, str]]]] = {}
+        self._etags_dirty = False
+        self.cache_dir = cache_dir
+        if cache_dir:
+            self._etag_cache_path = os.path.join(cache_dir, owner, f"{repo}.json")
+            self._load_etag_cache()
+        
         # Headers for Security Advisories API (requires different accept header)
         self.advisory_headers = {
             "Authorization": f"token {token}",
@@ -53,132 +221,502 @@ class GitHubClient:
             "User-Agent": "tfgitsec/1.0.0",
             "X-GitHub-Api-Version": "2022-11-28"
         }
+        self._advisory_session = self._new_session(self.advisory_headers)
         
         if self.debug:
             self._debug_print(f"GitHubClient initialized for {owner}/{repo}")
             self._debug_print(f"API Base URL: {api_base_url}")
             self._debug_print(f"Web Base URL: {web_base_url}")
     
+    @staticmethod
+    def _new_session(headers: Dict[str, str]) -> requests.Session:
+        """Create a pooled session that sends the given headers on every request"""
+        session = requests.Session()
+        session.headers.update(headers)
+        # Each session talks to a single API host; keep just enough connections
+        # alive for the busiest concurrent phase so none are opened and discarded
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=max(_MAX_PAGE_WORKERS, _MAX_CONCURRENT_WRITES),
+            max_retries=_retry_policy()
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+    
+    def close(self) -> None:
+        """Save the ETag cache and close the underlying HTTP sessions"""
+        self._save_etag_cache()
+        self._session.close()
+        self._advisory_session.close()
+    
     def _debug_print(self, message: str) -> None:
         """Print debug message if debug is enabled"""
         if self.debug:
             timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
             print(f"🔧 [{timestamp}] DEBUG: {message}", file=sys.stderr)
 
-    def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None) -> Dict[str, Any]:
+    def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None, *,
+                      session: Optional[requests.Session] = None, label: str = "") -> Dict[str, Any]:
         """Make a request to the GitHub API"""
-        # Strip trailing slash to ensure compatibility with GitHub Enterprise
-        url = f"{self.api_base_url}/repos/{self.owner}/{self.repo}/{endpoint}".rstrip('/')
+        payload, _ = self._request_json(method, endpoint, data, session=session, label=label)
+        return payload
+    
+    def _request_json(self, method: str, endpoint: str, data: Optional[Dict] = None, *,
+                      session: Optional[requests.Session] = None, label: str = "") -> Tuple[Any, Dict[str, Dict[str, str]]]:
+        """Make a request and return the decoded body together with its Link relations
+        
+        session and label are passed through to _request().
+        """
+        response = self._request(method, endpoint, data, session=session, label=label)
+        return self._decode_json(response, label), response.links
+    
+    def _request_json_conditional(self, method: str, endpoint: str, data: Optional[Dict] = None, *,
+                                  session: Optional[requests.Session] = None,
+                                  label: str = "") -> Tuple[Any, Dict[str, Dict[str, str]], bool]:
+        """Like _request_json(), keeping GET responses in the ETag cache
         
-        self._debug_print(f"Making HTTP request:")
-        self._debug_print(f"  Method: {method.upper()}")
-        self._debug_print(f"  URL: {url}")
-        if data:
-            self._debug_print(f"  Data: {data}")
+        GET requests are sent with If-None-Match when an ETag was seen for the
+        same endpoint and parameters; a 304 Not Modified then returns the cached
+        body without downloading or decoding it. Every body is kept for the
+        client's lifetime (and saved with cache_dir), so this is only used for
+        the tfgitsec issue listing. Also reports whether the cached body was
+        reused (304).
+        """
+        cache_key = None
+        cached = None
+        headers = None
+        if method.upper() == "GET":
+            cache_key = (endpoint, tuple(sorted((data or {}).items())))
+            cached = self._etags.get(cache_key)
+            if cached is not None:
+                headers = {"If-None-Match": cached[0]}
+        
+        response = self._request(method, endpoint, data, headers, session=session, label=label)
+        
+        if response.status_code == 304 and cached is not None:
+            if self.debug:
+                self._debug_print("  Not modified, using cached response")
+            return cached[1], cached[2], True
+        
+        payload = self._decode_json(response, label)
         
+        etag = response.headers.get("ETag")
+        if cache_key is not None and etag:
+            self._etags[cache_key] = (etag, payload, response.links)
+            self._etags_dirty = True
+        
+        return payload, response.links, False
+    
+    @staticmethod
+    def _decode_json(response: requests.Response, label: str = "") -> Any:
+        """Decode a JSON response body"""
         try:
-            if method.upper() == "GET":
-                response = requests.get(url, headers=self.headers, params=data, timeout=30)
-            elif method.upper() == "POST":
-                response = requests.post(url, headers=self.headers, json=data, timeout=30)
-            elif method.upper() == "PATCH":
-                response = requests.patch(url, headers=self.headers, json=data, timeout=30)
-            else:
-                raise GitHubAPIError(f"Unsupported HTTP method: {method}")
-            
-            self._debug_print(f"HTTP Response:")
-            self._debug_print(f"  Status: {response.status_code} {response.reason}")
-            self._debug_print(f"  Headers: Content-Type={response.headers.get('Content-Type', 'Unknown')}")
+            return _json.loads(response.content)
+        except ValueError as e:
+            raise GitHubAPIError(f"Invalid JSON in {label or 'GitHub'} API response: {e}")
+    
+    def _load_etag_cache(self) -> None:
+        """Load ETags and cached bodies saved by a previous run, if any"""
+        try:
+            with open(self._etag_cache_path, "rb") as f:
+                saved = _json.loads(f.read())
+        except (OSError, ValueError):
+            return
+        
+        if not isinstance(saved, dict) or saved.get("version") != _ETAG_CACHE_VERSION:
+            self._debug_print(f"Ignoring ETag cache with unknown layout: {self._etag_cache_path}")
+            return
+        
+        for endpoint, params, etag, body, links in saved.get("entries", ()):
+            key = (endpoint, tuple((name, value) for name, value in params))
+            self._etags.setdefault(key, (etag, body, links))
+        self._debug_print(f"Loaded {len(self._etags)} cached responses from {self._etag_cache_path}")
+    
+    def _save_etag_cache(self) -> None:
+        """Write ETags and cached bodies to cache_dir if anything changed"""
+        if not self.cache_dir or not self._etags_dirty:
+            return
+        
+        entries = [[endpoint, [list(param) for param in params], etag, body, links]
+                   for (endpoint, params), (etag, body, links) in list(self._etags.items())]
+        data = _json_dumps({"version": _ETAG_CACHE_VERSION, "entries": entries})
+        
+        # Write to a temporary file first so readers never see a partial cache.
+        # Cached bodies include full issue text, so keep them private to the user.
+        tmp_path = f"{self._etag_cache_path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self._etag_cache_path), mode=0o700, exist_ok=True)
+            with os.fdopen(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self._etag_cache_path)
+        except OSError as e:
+            self._debug_print(f"Could not save ETag cache: {e}")
+            return
+        self._etags_dirty = False
+    
+    def _repo_url(self, endpoint: str) -> str:
+        """Build the URL for a repository endpoint
+        
+        An empty endpoint gives the repository URL itself, without a trailing
+        slash, for compatibility with GitHub Enterprise. An absolute URL, such
+        as a rel="next" Link header, is used as it is, but only on the API host
+        so the token is never sent elsewhere.
+        """
+        if endpoint.startswith(("https://", "http://")):
+            if urlparse(endpoint).hostname != self._api_hostname:
+                raise GitHubAPIError(f"Refusing to follow link to another host: {endpoint}")
+            return endpoint
+        return f"{self._repo_url_base}/{endpoint}" if endpoint else self._repo_url_base
+    
+    def _request(self, method: str, endpoint: str, data: Optional[Dict] = None,
+                 headers: Optional[Dict[str, str]] = None, *,
+                 session: Optional[requests.Session] = None, label: str = "") -> requests.Response:
+        """Make a request to the GitHub API and return the raw response
+        
+        Args:
+            method: HTTP method
+            endpoint: Path below /repos/{owner}/{repo}
+            data: Query parameters for GET/HEAD, JSON body otherwise
+            headers: Extra headers for this request only
+            session: Session to send on (defaults to the issues API session)
+            label: Name of the API used in debug output and error messages,
+                e.g. "Security Advisory"
+        """
+        url = self._repo_url(endpoint)
+        method = method.upper()
+        api = f"{label} " if label else ""
+        
+        # Guarded so the messages are not even formatted unless debugging
+        if self.debug:
+            self._debug_print(f"Making {api}HTTP request:")
+            self._debug_print(f"  Method: {method}")
+            self._debug_print(f"  URL: {url}")
+            if data:
+                self._debug_print(f"  Data: {data}")
+        
+        try:
+            response = self._send(session or self._session, method, url, data, headers)
+            # The only place rate limits are retried; the sleep happens outside
+            # _send so no concurrent-write slot is held meanwhile
+            for attempt in range(_SECONDARY_LIMIT_RETRIES):
+                if not self._is_secondary_rate_limited(response):
+                    break
+                delay = self._secondary_backoff_seconds(response, attempt)
+                if self.debug:
+                    self._debug_print(f"Secondary rate limit hit, retrying in {delay}s")
+                time.sleep(delay)
+                response = self._send(session or self._session, method, url, data, headers)
             
-            # Show response body for errors or if it's small
-            if response.status_code >= 400 or len(response.content) < 1000:
-                try:
-                    response_text = response.text[:500]
-                    if len(response.text) > 500:
-                        response_text += "..."
-                    self._debug_print(f"  Body: {response_text}")
-                except:
-                    self._debug_print(f"  Body: <binary content>")
+            if self.debug:
+                self._debug_print(f"{api}HTTP Response:")
+                self._debug_print(f"  Status: {response.status_code} {response.reason}")
+                self._debug_print(f"  Headers: Content-Type={response.headers.get('Content-Type', 'Unknown')}")
+                
+                # Show response body for errors or if it's small
+                if response.status_code >= 400 or len(response.content) < 1000:
+                    try:
+                        response_text = response.text[:500]
+                        if len(response.text) > 500:
+                            response_text += "..."
+                        self._debug_print(f"  Body: {response_text}")
+                    except:
+                        self._debug_print(f"  Body: <binary content>")
             
-            # Handle rate limiting
-            if response.status_code == 403:
-                if "rate limit" in response.text.lower():
-                    raise GitHubAPIError("GitHub API rate limit exceeded")
-                elif "not found" not in response.text.lower():
-                    # Might be a permissions issue
-                    raise GitHubAPIError(f"Access denied (403): {response.text[:200]}")
+            # Rate limits still in effect after the adapter's retries gave up
+            if response.status_code in (403, 429) and self._is_rate_limited(response):
+                retry_after = self._retry_after_seconds(response)
+                raise GitHubAPIError(f"GitHub API rate limit exceeded, retry after {retry_after}s")
+            if self._is_secondary_rate_limited(response):
+                raise GitHubAPIError("GitHub API secondary rate limit exceeded")
+            if response.status_code == 403 and "not found" not in response.text.lower():
+                # Might be a permissions issue
+                hint = f" - {label} API requires appropriate permissions" if label else ""
+                raise GitHubAPIError(f"Access denied (403){hint}: {response.text[:200]}")
             
             # Handle common errors with better messages
             if response.status_code == 404:
-                raise GitHubAPIError(f"Repository '{self.owner}/{self.repo}' not found or token lacks access")
+                raise GitHubAPIError(f"Repository '{self.owner}/{self.repo}' not found or token lacks {api}access")
             elif response.status_code == 401:
-                raise GitHubAPIError("Authentication failed - check your GitHub token")
+                hint = f" has {label} permissions" if label else ""
+                raise GitHubAPIError(f"Authentication failed - check your GitHub token{hint}")
+            elif response.status_code == 422:
+                raise GitHubAPIError(f"Invalid {label or 'request'} data: {response.text[:200]}")
             
             response.raise_for_status()
-            return response.json()
+            return response
             
         except requests.exceptions.ConnectTimeout:
-            raise GitHubAPIError(f"Connection timeout to {urlparse(url).hostname}")
+            raise GitHubAPIError(f"Connection timeout to {self._api_hostname}")
         except requests.exceptions.SSLError as e:
             raise GitHubAPIError(f"SSL certificate error: {e}")
         except requests.exceptions.ConnectionError as e:
             if "Name or service not known" in str(e) or "nodename nor servname provided" in str(e):
-                raise GitHubAPIError(f"DNS resolution failed for {urlparse(url).hostname}")
+                raise GitHubAPIError(f"DNS resolution failed for {self._api_hostname}")
             elif "Connection refused" in str(e):
-                raise GitHubAPIError(f"Connection refused by {urlparse(url).hostname}")
+                raise GitHubAPIError(f"Connection refused by {self._api_hostname}")
             else:
                 raise GitHubAPIError(f"Network connection error: {e}")
         except requests.exceptions.RequestException as e:
-            raise GitHubAPIError(f"HTTP request failed: {e}")
+            raise GitHubAPIError(f"{api}HTTP request failed: {e}")
+    
+    # Session method used for each supported HTTP verb
+    _HTTP_METHODS = {"GET": "get", "HEAD": "head", "POST": "post", "PATCH": "patch"}
+    
+    def _send(self, session: requests.Session, method: str, url: str, data: Optional[Dict],
+              headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """Send a request on session; GET/HEAD pass data as query parameters, other methods as a JSON body"""
+        name = self._HTTP_METHODS.get(method)
+        if name is None:
+            raise GitHubAPIError(f"Unsupported HTTP method: {method}")
+        send = getattr(session, name)
+        
+        if method in ("GET", "HEAD"):
+            return send(url, params=data, headers=headers, timeout=30)
+        body = None if data is None else _json_dumps(data)
+        with self._write_slots:
+            return send(url, data=body, headers={**_JSON_HEADERS, **(headers or {})}, timeout=30)
+    
+    @staticmethod
+    def _is_rate_limited(response: requests.Response) -> bool:
+        """Check the rate limit headers (primary and secondary limits)"""
+        return response.headers.get("X-RateLimit-Remaining") == "0" or "Retry-After" in response.headers
+    
+    @staticmethod
+    def _is_secondary_rate_limited(response: requests.Response) -> bool:
+        """Check for a secondary (abuse) rate limit, which clears within minutes
+        
+        An exhausted primary limit may not reset for an hour, so it is not retried,
+        whether GitHub reports it as a 403 or a 429.
+        """
+        if response.headers.get("X-RateLimit-Remaining") == "0":
+            return False
+        if response.status_code == 429:
+            return True
+        if response.status_code != 403:
+            return False
+        return "Retry-After" in response.headers or "secondary rate limit" in response.text.lower()
+    
+    @classmethod
+    def _secondary_backoff_seconds(cls, response: requests.Response, attempt: int) -> int:
+        """Seconds to wait before retrying a secondary rate limit"""
+        if "Retry-After" in response.headers:
+            return min(cls._retry_after_seconds(response), 60)
+        return _SECONDARY_LIMIT_BACKOFF * 2 ** attempt
+    
+    @staticmethod
+    def _retry_after_seconds(response: requests.Response) -> int:
+        """Seconds until the rate limit resets, from Retry-After or X-RateLimit-Reset"""
+        try:
+            if "Retry-After" in response.headers:
+                return int(response.headers["Retry-After"])
+            if "X-RateLimit-Reset" in response.headers:
+                return max(0, int(response.headers["X-RateLimit-Reset"]) - int(time.time()))
+        except ValueError:
+            pass
+        return 60
     
     def get_issues(self, state: str = "all", labels: Optional[List[str]] = None) -> List[GitHubIssue]:
         """Get issues from the repository
         
+        The first page is fetched on its own; if its Link header names the last
+        page, the remaining pages are fetched concurrently. Otherwise each next
+        page is prefetched while the current one is being converted.
+        
+        Args:
+            state: Issue state ('open', 'closed', 'all')
+            labels: Filter by labels
+        """
+        issues, _ = self._list_issues(self._issue_list_params(state, labels))
+        return issues
+    
+    def _list_issues(self, params: Dict[str, Any], conditional: bool = False) -> Tuple[List[GitHubIssue], bool]:
+        """Fetch every page of an issue listing (see get_issues)
+        
+        With conditional set, pages go through the ETag cache. Returns the issues
+        and whether every page was answered 304 Not Modified.
+        """
+        if conditional:
+            request_page = self._request_json_conditional
+        else:
+            def request_page(method: str, endpoint: str, data: Optional[Dict] = None) -> Tuple[Any, Dict[str, Dict[str, str]], bool]:
+                return (*self._request_json(method, endpoint, data), False)
+        
+        issues_data, links, not_modified = request_page("GET", "issues", {**params, "page": 1})
+        all_issues = self._issues_from_page(issues_data)
+        
+        def fetch_page(url: str) -> Tuple[Any, Dict[str, Dict[str, str]], bool]:
+            return request_page("GET", url)
+        
+        for page_data, _, page_not_modified in self._fetch_all_pages(fetch_page, links):
+            all_issues.extend(self._issues_from_page(page_data))
+            not_modified = not_modified and page_not_modified
+        return all_issues, not_modified
+    
+    def iter_issues(self, state: str = "all", labels: Optional[List[str]] = None) -> Iterator[GitHubIssue]:
+        """Yield issues from the repository one page at a time
+        
+        Streaming counterpart of get_issues(): only one page of issues is built at
+        a time, and the next page is only requested once the current one has been
+        consumed, so callers that stop early skip the remaining round trips.
+        
         Args:
             state: Issue state ('open', 'closed', 'all')
             labels: Filter by labels
         """
+        endpoint, params = "issues", self._issue_list_params(state, labels)
+        
+        while True:
+            issues_data, links = self._request_json("GET", endpoint, params)
+            
+            # Build each issue only as the caller asks for it
+            for issue_data in issues_data:
+                if "pull_request" not in issue_data:
+                    yield GitHubIssue.from_api(issue_data)
+            
+            # The Link header omits rel="next" on the last page; its URL already
+            # carries the query parameters (page number or cursor)
+            if "next" not in links:
+                return
+            endpoint, params = links["next"]["url"], None
+    
+    @staticmethod
+    def _issue_list_params(state: str, labels: Optional[List[str]]) -> Dict[str, Any]:
+        """Build the query parameters for listing issues"""
         params = {"state": state, "per_page": 100}
         if labels:
             params["labels"] = ",".join(labels)
+        return params
+    
+    @staticmethod
+    def _last_page_number(links: Dict[str, Dict[str, str]]) -> Optional[int]:
+        """Return the page number of the rel="last" Link header, if present"""
+        last_url = links.get("last", {}).get("url")
+        if not last_url:
+            return None
+        try:
+            return int(parse_qs(urlparse(last_url).query)["page"][0])
+        except (KeyError, IndexError, ValueError):
+            return None
+    
+    def _fetch_all_pages(self, fetch_page: Callable[[str], Tuple], links: Dict[str, Dict[str, str]]) -> Iterator[Tuple]:
+        """Yield fetch_page() for every page after the first, in page order
         
-        all_issues = []
-        page = 1
+        If the first page's Link header names the last page, the remaining pages
+        are fetched concurrently. Otherwise rel="next" is followed serially, as
+        given (some endpoints paginate with cursors), requesting each page in the
+        background while the previous one is consumed.
         
-        while True:
-            params["page"] = page
-            issues_data = self._make_request("GET", "issues", params)
-            
-            if not issues_data:
-                break
+        Args:
+            fetch_page: Fetches a page URL and returns a tuple whose second item
+                is that page's Link relations
+            links: Link relations of the first page
+        """
+        last_page = self._last_page_number(links)
+        if last_page is not None and last_page > 1:
+            last_url = links["last"]["url"]
+            page_urls = [self._page_url(last_url, page) for page in range(2, last_page + 1)]
+            # map() yields results in page order regardless of completion order
+            with ThreadPoolExecutor(max_workers=min(_MAX_PAGE_WORKERS, last_page - 1)) as executor:
+                yield from executor.map(fetch_page, page_urls)
+            return
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            next_page = executor.submit(fetch_page, links["next"]["url"]) if "next" in links else None
+            while next_page is not None:
+                result = next_page.result()
+                links = result[1]
+                next_page = executor.submit(fetch_page, links["next"]["url"]) if "next" in links else None
+                yield result
+    
+    @staticmethod
+    def _page_url(last_url: str, page: int) -> str:
+        """Return the rel="last" URL with its page number replaced"""
+        parts = urlparse(last_url)
+        query = parse_qs(parts.query, keep_blank_values=True)
+        query["page"] = [str(page)]
+        return urlunparse(parts._replace(query=urlencode(query, doseq=True)))
+    
+    @staticmethod
+    def _issues_from_page(issues_data: List[Dict[str, Any]]) -> List[GitHubIssue]:
+        """Convert one page of issue payloads into GitHubIssue objects"""
+        issues = []
+        for issue_data in issues_data:
+            # Skip pull requests (they show up in issues endpoint)
+            if "pull_request" in issue_data:
+                continue
             
-            for issue_data in issues_data:
-                # Skip pull requests (they show up in issues endpoint)
-                if "pull_request" in issue_data:
-                    continue
-                
-                issue = GitHubIssue(
-                    number=int(issue_data.get("number", 0)),
-                    title=str(issue_data.get("title", "")),
-                    state=str(issue_data.get("state", "")),
-                    labels=[str(label.get("name", "")) for label in issue_data.get("labels", []) if isinstance(label, dict)],
-                    created_at=str(issue_data.get("created_at", "")),
-                    updated_at=str(issue_data.get("updated_at", "")),
-                    body=str(issue_data.get("body") or "")
-                )
-                all_issues.append(issue)
+            issues.append(GitHubIssue.from_api(issue_data))
+        return issues
+    
+    def get_tfsec_issues(self) -> List[GitHubIssue]:
+        """Get all issues created by tfgitsec"""
+        issues, _ = self.get_tfsec_issues_cached()
+        return issues
+    
+    def get_tfsec_issues_cached(self) -> Tuple[List[GitHubIssue], bool]:
+        """Get all issues created by tfgitsec, reusing cached pages where possible
+        
+        Every page is requested with If-None-Match using the ETags from earlier
+        listings, which are kept across runs when cache_dir is set. Pages answered
+        with 304 Not Modified are neither downloaded nor decoded, and do not count
+        against the primary rate limit.
+        
+        Returns:
+            (issues, was_304): was_304 is True when every page was unchanged. The
+            issue objects from the previous listing in this process are then
+            returned as they are, so their parsed unique IDs are reused too.
+        """
+        issues, was_304 = self._list_issues(self._issue_list_params("all", ["tfsec-security"]), conditional=True)
+        
+        previous = self._tfsec_issues_cache
+        if was_304 and previous is not None:
+            issues = previous[1]
+        
+        self._tfsec_issues_cache = (time.monotonic(), issues)
+        self._save_etag_cache()
+        return issues, was_304
+    
+    def get_tfsec_issues_graphql(self) -> List[GitHubIssue]:
+        """Get all issues created by tfgitsec with a GraphQL query
+        
+        Only issues carrying the tfsec-security label are returned, and only the
+        fields GitHubIssue needs are transferred. Raises GitHubAPIError if the
+        GraphQL API is unavailable, so callers can fall back to get_tfsec_issues().
+        """
+        issues = []
+        variables = {"owner": self.owner, "name": self.repo, "cursor": None}
+        
+        while True:
+            data = self._graphql(_TFSEC_ISSUES_QUERY, variables, mutation=False)
+            connection = (data.get("repository") or {}).get("issues")
+            if connection is None:
+                raise GitHubAPIError(f"Repository '{self.owner}/{self.repo}' not found or token lacks access")
             
-            page += 1
+            issues.extend(GitHubIssue.from_graphql(node) for node in connection.get("nodes") or () if node)
             
-            # GitHub returns less than per_page items on the last page
-            if len(issues_data) < params["per_page"]:
+            page_info = connection.get("pageInfo") or {}
+            if not page_info.get("hasNextPage"):
                 break
+            variables["cursor"] = page_info.get("endCursor")
         
-        return all_issues
+        self._tfsec_issues_cache = (time.monotonic(), issues)
+        return issues
     
-    def get_tfsec_issues(self) -> List[GitHubIssue]:
-        """Get all issues created by tfgitsec"""
-        return self.get_issues(labels=["tfsec-security"])
+    def iter_tfsec_issues(self) -> Iterator[GitHubIssue]:
+        """Yield issues created by tfgitsec without building the full list"""
+        return self.iter_issues(labels=["tfsec-security"])
+    
+    def _cached_tfsec_issues(self, ttl: float = 60.0) -> List[GitHubIssue]:
+        """Return the tfgitsec issues from the last listing if it is newer than ttl seconds"""
+        cached = self._tfsec_issues_cache
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        return self.get_tfsec_issues()
+    
+    def invalidate_issues_cache(self) -> None:
+        """Forget the cached tfgitsec issue listing (called after every issue write)"""
+        self._tfsec_issues_cache = None
     
     def create_issue(self, title: str, body: str, labels: List[str]) -> GitHubIssue:
         """Create a new GitHub issue"""
@@ -189,16 +727,9 @@ class GitHubClient:
         }
         
         issue_data = self._make_request("POST", "issues", data)
+        self.invalidate_issues_cache()
         
-        return GitHubIssue(
-            number=int(issue_data.get("number", 0)),
-            title=str(issue_data.get("title", "")),
-            state=str(issue_data.get("state", "")),
-            labels=[str(label.get("name", "")) for label in issue_data.get("labels", []) if isinstance(label, dict)],
-            created_at=str(issue_data.get("created_at", "")),
-            updated_at=str(issue_data.get("updated_at", "")),
-            body=str(issue_data.get("body") or "")
-        )
+        return GitHubIssue.from_api(issue_data)
     
     def update_issue(self, issue_number: int, title: Optional[str] = None, 
                     body: Optional[str] = None, state: Optional[str] = None,
@@ -216,27 +747,68 @@ class GitHubClient:
             data["labels"] = labels
         
         issue_data = self._make_request("PATCH", f"issues/{issue_number}", data)
+        self.invalidate_issues_cache()
         
-        return GitHubIssue(
-            number=int(issue_data.get("number", 0)),
-            title=str(issue_data.get("title", "")),
-            state=str(issue_data.get("state", "")),
-            labels=[str(label.get("name", "")) for label in issue_data.get("labels", []) if isinstance(label, dict)],
-            created_at=str(issue_data.get("created_at", "")),
-            updated_at=str(issue_data.get("updated_at", "")),
-            body=str(issue_data.get("body") or "")
-        )
+        return GitHubIssue.from_api(issue_data)
     
-    def close_issue_with_comment(self, issue_number: int, comment: str) -> GitHubIssue:
-        """Close an issue and add a comment"""
+    def close_issue_with_comment(self, issue_number: int, comment: str, node_id: Optional[str] = None) -> GitHubIssue:
+        """Close an issue and add a comment
+        
+        With the issue's GraphQL node_id both steps are sent as a single
+        GraphQL request; otherwise (or if GraphQL is unavailable) two REST calls are made.
+        Other GraphQL failures are raised rather than replayed over REST, since the
+        mutation may already have been applied.
+        """
+        if node_id and self.graphql_available:
+            try:
+                data = self._graphql(_CLOSE_WITH_COMMENT_MUTATION, {"id": node_id, "body": comment})
+            except GraphQLUnavailableError as e:
+                self._debug_print(f"GraphQL close failed, falling back to REST: {e}")
+                self.graphql_available = False
+            else:
+                self.invalidate_issues_cache()
+                
+                # Finish any half of the mutation that did not apply
+                if data.get("addComment") is None:
+                    self.add_comment(issue_number, comment)
+                closed = data.get("closeIssue")
+                if closed is None:
+                    return self.update_issue(issue_number, state="closed")
+                return GitHubIssue.from_graphql(closed["issue"])
+        
         # Add comment first
         self.add_comment(issue_number, comment)
         
         # Then close the issue
         return self.update_issue(issue_number, state="closed")
     
-    def reopen_issue_with_comment(self, issue_number: int, comment: str) -> GitHubIssue:
-        """Reopen an issue and add a comment"""
+    def reopen_issue_with_comment(self, issue_number: int, comment: str, node_id: Optional[str] = None) -> GitHubIssue:
+        """Reopen an issue and add a comment
+        
+        With the issue's GraphQL node_id both steps are sent as a single
+        GraphQL request; otherwise (or if GraphQL is unavailable) two REST calls are made.
+        Other GraphQL failures are raised rather than replayed over REST, since the
+        mutation may already have been applied.
+        """
+        if node_id and self.graphql_available:
+            try:
+                data = self._graphql(_REOPEN_WITH_COMMENT_MUTATION, {"id": node_id, "body": comment})
+            except GraphQLUnavailableError as e:
+                self._debug_print(f"GraphQL reopen failed, falling back to REST: {e}")
+                self.graphql_available = False
+            else:
+                self.invalidate_issues_cache()
+                
+                # Finish any half of the mutation that did not apply
+                reopened = data.get("reopenIssue")
+                if reopened is None:
+                    updated_issue = self.update_issue(issue_number, state="open")
+                else:
+                    updated_issue = GitHubIssue.from_graphql(reopened["issue"])
+                if data.get("addComment") is None:
+                    self.add_comment(issue_number, comment)
+                return updated_issue
+        
         # Reopen the issue first
         updated_issue = self.update_issue(issue_number, state="open")
         
@@ -245,6 +817,61 @@ class GitHubClient:
         
         return updated_issue
     
+    def _graphql(self, query: str, variables: Dict[str, Any], mutation: bool = True) -> Dict[str, Any]:
+        """Run a GraphQL query or mutation and return its data
+        
+        Raises GraphQLUnavailableError when nothing was executed: the connection
+        could not be made, GitHub refused the request (4xx, e.g. GitHub Enterprise
+        without GraphQL), or it failed as a whole (data null, with errors, such as
+        a schema mismatch). Other failures (5xx, read timeouts) raise GitHubAPIError,
+        as a mutation may have been applied before they happened.
+        Field-level errors leave the corresponding entries of the returned data as None.
+        Mutations share the client's write slots; read-only queries do not.
+        """
+        if self.debug:
+            self._debug_print(f"Making GraphQL request to {self.graphql_url}")
+        try:
+            body = _json_dumps({"query": query, "variables": variables})
+            if mutation:
+                with self._write_slots:
+                    response = self._session.post(self.graphql_url, data=body, headers=_JSON_HEADERS, timeout=30)
+            else:
+                response = self._session.post(self.graphql_url, data=body, headers=_JSON_HEADERS, timeout=30)
+            response.raise_for_status()
+            payload = _json.loads(response.content)
+        except requests.exceptions.HTTPError as e:
+            if 400 <= e.response.status_code < 500:
+                raise GraphQLUnavailableError(f"GraphQL request failed: {e}")
+            raise GitHubAPIError(f"GraphQL request failed: {e}")
+        except (requests.exceptions.RequestException, ValueError) as e:
+            if self._never_connected(e):
+                raise GraphQLUnavailableError(f"GraphQL request failed: {e}")
+            raise GitHubAPIError(f"GraphQL request failed: {e}")
+        
+        data = payload.get("data")
+        if data is None:
+            errors = payload.get("errors") or ()
+            messages = "; ".join(error.get("message", "") for error in errors)
+            error_class = GraphQLUnavailableError if errors else GitHubAPIError
+            raise error_class(f"GraphQL request failed: {messages or 'no data returned'}")
+        if payload.get("errors") and self.debug:
+            self._debug_print(f"GraphQL partial errors: {payload['errors']}")
+        return data
+    
+    @staticmethod
+    def _never_connected(error: Exception) -> bool:
+        """Whether a request failed before reaching GitHub (DNS, refused, connect timeout)
+        
+        A connection dropped after the request was sent also surfaces as a
+        ConnectionError, but without a connect-time cause.
+        """
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return True
+        if not isinstance(error, requests.exceptions.ConnectionError) or not error.args:
+            return False
+        # requests wraps urllib3's MaxRetryError, whose reason is the last connect failure
+        return isinstance(getattr(error.args[0], "reason", None), ConnectTimeoutError)
+    
     def add_comment(self, issue_number: int, comment: str) -> Dict[str, Any]:
         """Add a comment to an issue"""
         data = {"body": comment}
@@ -252,26 +879,11 @@ class GitHubClient:
     
     def test_connection(self) -> bool:
         """Test if we can connect to the GitHub API"""
-        self._debug_print("Starting comprehensive connection test")
-        
-        # Test DNS resolution if it's not github.com
-        parsed_url = urlparse(self.api_base_url)
-        hostname = parsed_url.hostname
-        
-        if hostname != "api.github.com":
-            self._debug_print(f"Testing DNS resolution for {hostname}")
-            try:
-                import socket
-                ip = socket.gethostbyname(hostname)
-                self._debug_print(f"DNS resolution successful: {hostname} -> {ip}")
-            except socket.gaierror as e:
-                self._debug_print(f"DNS resolution failed: {e}")
-                return False
-        
-        # Test basic repository access
+        # DNS failures surface from the request itself as "DNS resolution failed"
         try:
             self._debug_print("Testing repository access")
-            self._make_request("GET", "")
+            # HEAD proves access to the repository without downloading its metadata
+            self._request("HEAD", "")
             self._debug_print("Repository access successful")
             return True
         except GitHubAPIError as e:
@@ -286,79 +898,80 @@ class GitHubClient:
             labels=finding.get_github_labels()
         )
     
+    def create_issues_bulk(self, items: List[Tuple[TfSecFinding, str]], max_workers: int = _MAX_CONCURRENT_WRITES,
+                           return_exceptions: bool = False) -> List[Union[GitHubIssue, GitHubAPIError]]:
+        """Create issues for many findings concurrently
+        
+        Args:
+            items: (finding, issue_body) pairs
+            max_workers: Maximum requests in flight; writes from all threads are
+                additionally capped at _MAX_CONCURRENT_WRITES per client
+            return_exceptions: If True, a failed creation yields its GitHubAPIError in
+                place of the issue instead of raising
+        
+        Returns:
+            Created issues in the same order as items
+        """
+        return self._run_bulk(self.create_issue_from_finding, items, max_workers, return_exceptions)
+    
+    def _run_bulk(self, create: Callable[[TfSecFinding, str], Any], items: List[Tuple[TfSecFinding, str]],
+                  max_workers: int, return_exceptions: bool) -> List[Any]:
+        """Call create(finding, body) for every item on a thread pool, preserving order"""
+        if not items:
+            return []
+        
+        def run(item: Tuple[TfSecFinding, str]) -> Any:
+            try:
+                return create(*item)
+            except GitHubAPIError as e:
+                if return_exceptions:
+                    return e
+                raise
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            return list(executor.map(run, items))
+    
     def get_issue_url(self, issue_number: int) -> str:
         """Get the web URL for an issue"""
         return f"{self.web_base_url}/{self.owner}/{self.repo}/issues/{issue_number}"
     
-    def find_issue_by_unique_id(self, unique_id: str, issues: Optional[List[GitHubIssue]] = None) -> Optional[GitHubIssue]:
-        """Find an existing issue by the unique ID (resource[rule_id])"""
-        if issues is None:
-            issues = self.get_tfsec_issues()
+    def build_issue_index(self, issues: List[GitHubIssue]) -> Dict[str, GitHubIssue]:
+        """Map unique ID (resource[rule_id]) -> issue for O(1) lookups
         
-        for issue in issues:
-            if issue.extract_unique_id() == unique_id:
-                return issue
+        Issues without the tfsec label are skipped before their titles are parsed.
+        """
+        return {uid: issue for issue in issues
+                if issue.is_tfsec_issue and (uid := issue.extract_unique_id()) is not None}
+    
+    def find_issue_by_unique_id(self, unique_id: str, issues: Optional[List[GitHubIssue]] = None,
+                                index: Optional[Dict[str, GitHubIssue]] = None) -> Optional[GitHubIssue]:
+        """Find an existing issue by the unique ID (resource[rule_id])
         
-        return None
+        When looking up many IDs, build the index once with
+        build_issue_index() and pass it as ``index`` instead of ``issues``.
+        Without either, the recently cached tfgitsec issue listing is searched.
+        """
+        if index is None:
+            if issues is None:
+                issues = self._cached_tfsec_issues()
+            
+            for issue in issues:
+                if issue.extract_unique_id() == unique_id:
+                    return issue
+            
+            return None
+        
+        return index.get(unique_id)
     
     # Security Advisory API Methods
     
     def _make_advisory_request(self, method: str, endpoint: str, data: Optional[Dict] = None) -> Dict[str, Any]:
         """Make a request to the GitHub Security Advisory API"""
-        # Strip trailing slash to ensure compatibility with GitHub Enterprise
-        url = f"{self.api_base_url}/repos/{self.owner}/{self.repo}/{endpoint}".rstrip('/')
-        
-        self._debug_print(f"Making Security Advisory HTTP request:")
-        self._debug_print(f"  Method: {method.upper()}")
-        self._debug_print(f"  URL: {url}")
-        if data:
-            self._debug_print(f"  Data: {data}")
-        
-        try:
-            if method.upper() == "GET":
-                response = requests.get(url, headers=self.advisory_headers, params=data, timeout=30)
-            elif method.upper() == "POST":
-                response = requests.post(url, headers=self.advisory_headers, json=data, timeout=30)
-            elif method.upper() == "PATCH":
-                response = requests.patch(url, headers=self.advisory_headers, json=data, timeout=30)
-            else:
-                raise GitHubAPIError(f"Unsupported HTTP method: {method}")
-            
-            self._debug_print(f"Security Advisory HTTP Response:")
-            self._debug_print(f"  Status: {response.status_code} {response.reason}")
-            self._debug_print(f"  Headers: Content-Type={response.headers.get('Content-Type', 'Unknown')}")
-            
-            # Show response body for errors or if it's small
-            if response.status_code >= 400 or len(response.content) < 1000:
-                try:
-                    response_text = response.text[:500]
-                    if len(response.text) > 500:
-                        response_text += "..."
-                    self._debug_print(f"  Body: {response_text}")
-                except:
-                    self._debug_print(f"  Body: <binary content>")
-            
-            # Handle rate limiting
-            if response.status_code == 403:
-                if "rate limit" in response.text.lower():
-                    raise GitHubAPIError("GitHub API rate limit exceeded")
-                elif "not found" not in response.text.lower():
-                    # Might be a permissions issue
-                    raise GitHubAPIError(f"Access denied (403) - Security Advisory API requires appropriate permissions: {response.text[:200]}")
-            
-            # Handle common errors with better messages
-            if response.status_code == 404:
-                raise GitHubAPIError(f"Repository '{self.owner}/{self.repo}' not found or token lacks Security Advisory access")
-            elif response.status_code == 401:
-                raise GitHubAPIError("Authentication failed - check your GitHub token has Security Advisory permissions")
-            elif response.status_code == 422:
-                raise GitHubAPIError(f"Invalid Security Advisory data: {response.text[:200]}")
-            
-            response.raise_for_status()
-            return response.json()
-            
-        except requests.exceptions.RequestException as e:
-            raise GitHubAPIError(f"Security Advisory HTTP request failed: {e}")
+        return self._make_request(method, endpoint, data, session=self._advisory_session, label="Security Advisory")
+    
+    def _advisory_request_json(self, method: str, endpoint: str, data: Optional[Dict] = None) -> Tuple[Any, Dict[str, Dict[str, str]]]:
+        """Make a Security Advisory API request and return the decoded body with its Link relations"""
+        return self._request_json(method, endpoint, data, session=self._advisory_session, label="Security Advisory")
     
     def create_security_advisory(self, title: str, description: str, severity: str, unique_id: str) -> Dict[str, Any]:
         """Create a GitHub Security Advisory from a TfSec finding
@@ -372,15 +985,7 @@ class GitHubClient:
         Returns:
             Dictionary with advisory data including ghsa_id and html_url
         """
-        # Map TfSec severity to GitHub Advisory severity
-        severity_map = {
-            "CRITICAL": "critical",
-            "HIGH": "high", 
-            "MEDIUM": "medium",
-            "LOW": "low"
-        }
-        
-        advisory_severity = severity_map.get(severity.upper(), "medium")
+        advisory_severity = _SEVERITY_MAP.get(severity.upper(), "medium")
         
         data = {
             "summary": title,
@@ -404,6 +1009,9 @@ class GitHubClient:
     def get_security_advisories(self, state: str = "all") -> List[Dict[str, Any]]:
         """Get Security Advisories for the repository
         
+        The first page is fetched on its own; if its Link header names the last
+        page, the remaining pages are fetched concurrently.
+        
         Args:
             state: Advisory state ('triage', 'draft', 'published', 'closed', 'all')
         """
@@ -411,22 +1019,15 @@ class GitHubClient:
         if state != "all":
             params["state"] = state
         
-        all_advisories = []
-        page = 1
+        first_page, links = self._advisory_request_json("GET", "security-advisories", params)
         
-        while True:
-            params["page"] = page
-            advisories_data = self._make_advisory_request("GET", "security-advisories", params)
-            
-            if not advisories_data:
-                break
-            
+        all_advisories = list(first_page)
+        
+        def fetch_page(url: str) -> Tuple[Any, Dict[str, Dict[str, str]]]:
+            return self._advisory_request_json("GET", url)
+        
+        for advisories_data, _ in self._fetch_all_pages(fetch_page, links):
             all_advisories.extend(advisories_data)
-            page += 1
-            
-            # GitHub returns less than per_page items on the last page
-            if len(advisories_data) < params["per_page"]:
-                break
         
         return all_advisories
     
@@ -454,29 +1055,41 @@ class GitHubClient:
         for vuln in vulnerabilities:
             functions = vuln.get("vulnerable_functions", [])
             for func in functions:
-                if "[" in func and "]" in func:  # Unique ID format: resource[rule_id]
+                if _UNIQUE_ID_RE.search(func):
                     return True
         
         return False
     
-    def find_advisory_by_unique_id(self, unique_id: str, advisories: Optional[List[Dict[str, Any]]] = None) -> Optional[Dict[str, Any]]:
-        """Find an existing Security Advisory by unique ID"""
-        if advisories is None:
-            advisories = self.get_tfsec_advisories()
+    def build_advisory_index(self, advisories: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Map unique ID (resource[rule_id]) -> advisory for O(1) lookups"""
+        return {uid: advisory for advisory in advisories
+                if (uid := self._extract_advisory_unique_id(advisory)) is not None}
+    
+    def find_advisory_by_unique_id(self, unique_id: str, advisories: Optional[List[Dict[str, Any]]] = None,
+                                   index: Optional[Dict[str, Dict[str, Any]]] = None) -> Optional[Dict[str, Any]]:
+        """Find an existing Security Advisory by unique ID
         
-        for advisory in advisories:
-            if self._extract_advisory_unique_id(advisory) == unique_id:
-                return advisory
+        When looking up many IDs, build the index once with
+        build_advisory_index() and pass it as ``index`` instead of ``advisories``.
+        """
+        if index is None:
+            if advisories is None:
+                advisories = self.get_tfsec_advisories()
+            
+            for advisory in advisories:
+                if self._extract_advisory_unique_id(advisory) == unique_id:
+                    return advisory
+            
+            return None
         
-        return None
+        return index.get(unique_id)
     
     def _extract_advisory_unique_id(self, advisory: Dict[str, Any]) -> Optional[str]:
         """Extract unique ID from Security Advisory"""
         vulnerabilities = advisory.get("vulnerabilities", [])
         for vuln in vulnerabilities:
-            functions = vuln.get("vulnerable_functions", [])
-            for func in functions:
-                if "[" in func and "]" in func:
+            for func in vuln.get("vulnerable_functions", []):
+                if _UNIQUE_ID_RE.search(func):
                     return func
         return None
     
@@ -514,3 +1127,19 @@ class GitHubClient:
             severity=finding.severity,
             unique_id=finding.unique_id
         )
+    
+    def create_advisories_bulk(self, items: List[Tuple[TfSecFinding, str]], max_workers: int = _MAX_CONCURRENT_WRITES,
+                               return_exceptions: bool = False) -> List[Union[Dict[str, Any], GitHubAPIError]]:
+        """Create Security Advisories for many findings concurrently
+        
+        Args:
+            items: (finding, advisory_description) pairs
+            max_workers: Maximum requests in flight; writes from all threads are
+                additionally capped at _MAX_CONCURRENT_WRITES per client
+            return_exceptions: If True, a failed creation yields its GitHubAPIError in
+                place of the advisory instead of raising
+        
+        Returns:
+            Created advisories in the same order as items
+        """
+        return self._run_bulk(self.create_advisory_from_finding, items, max_workers, return_exceptions)
@@ -1,8 +1,9 @@
 """
 Main issue management logic that orchestrates the full lifecycle
 """
-from typing import List, Dict, Set, Tuple, Any
+from typing import Callable, List, Dict, Set, Tuple, Any, Optional
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 from .models import TfSecFinding, GitHubIssue
 from .parser import TfSecParser, TfSecParseError
@@ -18,7 +19,8 @@ class IssueManagerError(Exception):
 class IssueManager:
     """Manages the complete lifecycle of security issues"""
     
-    def __init__(self, github_client: GitHubClient, auto_close: bool = True, dry_run: bool = False, use_security_advisories: bool = False):
+    def __init__(self, github_client: GitHubClient, auto_close: bool = True, dry_run: bool = False, use_security_advisories: bool = False,
+                 use_graphql: bool = True, max_workers: int = 1, verbose_actions: bool = False):
         """Initialize the issue manager
         
         Args:
@@ -26,12 +28,29 @@ class IssueManager:
             auto_close: Whether to automatically close resolved issues
             dry_run: If True, don't make any actual changes to GitHub
             use_security_advisories: If True, use Security Advisories instead of regular issues
+            use_graphql: If True, list existing issues with a single GraphQL query and
+                close/reopen them with one mutation each, falling back to REST if
+                GraphQL is unavailable
+            max_workers: Maximum issue create/reopen/close calls in flight at once;
+                the default of 1 makes them one at a time, in finding order
+            verbose_actions: If True, list every unchanged issue/advisory under
+                actions["unchanged"]; otherwise they are only counted in the summary
         """
         self.github = github_client
         self.auto_close = auto_close
         self.dry_run = dry_run
         self.use_security_advisories = use_security_advisories
+        self.use_graphql = use_graphql
+        self.max_workers = max_workers
+        self.verbose_actions = verbose_actions
         self.scan_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC")
+        
+        # The reopen/close comments only depend on the scan date
+        self._reopen_comment = IssueFormatter.format_reopen_comment(self.scan_date)
+        self._close_comment = IssueFormatter.format_close_comment(self.scan_date)
+        
+        # Issue web URLs only differ by number
+        self._issue_url_prefix = f"{github_client.web_base_url}/{github_client.repo_owner}/{github_client.repo_name}/issues/"
     
     def process_scan_results(self, tfsec_file_path: str) -> Dict[str, Any]:
         """Process TfSec scan results and manage GitHub issues
@@ -40,8 +59,7 @@ class IssueManager:
         """
         try:
             # Parse TfSec results
-            findings = TfSecParser.parse_file(tfsec_file_path)
-            stats = TfSecParser.validate_findings(findings)
+            findings, stats = TfSecParser.parse_file(tfsec_file_path, collect_stats=True)
             
             if self.use_security_advisories:
                 # Get existing tfsec Security Advisories from GitHub
@@ -51,7 +69,7 @@ class IssueManager:
                 result = self._process_findings_as_advisories(findings, existing_advisories, stats)
             else:
                 # Get existing tfsec issues from GitHub
-                existing_issues = self.github.get_tfsec_issues()
+                existing_issues = self._get_existing_issues()
                 
                 # Process findings and manage issues
                 result = self._process_findings(findings, existing_issues, stats)
@@ -65,6 +83,22 @@ class IssueManager:
         except Exception as e:
             raise IssueManagerError(f"Unexpected error: {e}")
     
+    def _get_existing_issues(self) -> List[GitHubIssue]:
+        """List existing tfsec issues, preferring GraphQL over REST pagination
+        
+        When the client keeps ETags between runs (cache_dir), the REST listing is
+        used instead: unchanged pages come back as free 304 responses.
+        """
+        if self.use_graphql and not self.github.cache_dir:
+            try:
+                return self.github.get_tfsec_issues_graphql()
+            except GitHubAPIError:
+                # e.g. GitHub Enterprise without GraphQL; don't retry it every scan
+                self.use_graphql = False
+        
+        issues, _ = self.github.get_tfsec_issues_cached()
+        return issues
+    
     def _process_findings(self, findings: List[TfSecFinding], 
                          existing_issues: List[GitHubIssue], 
                          stats: Dict[str, Any]) -> Dict[str, Any]:
@@ -72,9 +106,7 @@ class IssueManager:
         
         # Create maps for efficient lookups
         findings_by_id = {f.unique_id: f for f in findings}
-        existing_by_id = {uid: issue 
-                         for issue in existing_issues 
-                         if (uid := issue.extract_unique_id()) is not None}
+        existing_by_id = self.github.build_issue_index(existing_issues)
         
         # Track actions taken
         actions = {
@@ -85,28 +117,48 @@ class IssueManager:
             "errors": []
         }
         
-        # Process current findings
-        for finding in findings:
-            unique_id = finding.unique_id
-            existing_issue = existing_by_id.get(unique_id)
+        # Plan: decide what to do with each finding. Lookups used on every
+        # iteration are bound to locals once.
+        to_create: List[Tuple[TfSecFinding]] = []
+        to_reopen: List[Tuple[GitHubIssue, str]] = []
+        create_append = to_create.append
+        reopen_append = to_reopen.append
+        unchanged_append = actions["unchanged"].append
+        unchanged = 0
+        verbose_actions = self.verbose_actions
+        find_existing = existing_by_id.get
+        
+        # Process current findings (each unique ID once)
+        for unique_id, finding in findings_by_id.items():
+            existing_issue = find_existing(unique_id)
             
             if existing_issue is None:
                 # New finding - create issue
-                self._create_new_issue(finding, actions)
+                create_append((finding,))
             elif existing_issue.state == "closed":
                 # Finding reappeared - reopen issue
-                self._reopen_issue(existing_issue, actions)
+                reopen_append((existing_issue, unique_id))
             else:
                 # Issue already exists and is open - leave it
-                actions["unchanged"].append({
-                    "unique_id": unique_id,
-                    "issue_number": existing_issue.number,
-                    "title": existing_issue.title
-                })
+                unchanged += 1
+                if verbose_actions:
+                    unchanged_append({
+                        "unique_id": unique_id,
+                        "issue_number": existing_issue.number,
+                        "title": existing_issue.title
+                    })
         
         # Auto-close resolved issues if enabled
-        if self.auto_close:
-            self._close_resolved_issues(findings_by_id, existing_by_id, actions)
+        to_close = self._resolved_issues(findings_by_id, existing_by_id) if self.auto_close else []
+        
+        # Execute: make the GitHub calls together
+        create, reopen, close = self._create_new_issue, self._reopen_issue, self._close_issue
+        tasks: List[Tuple[Callable[..., Tuple[str, Dict[str, Any]]], tuple]] = [
+            *[(create, args) for args in to_create],
+            *[(reopen, args) for args in to_reopen],
+            *[(close, args) for args in to_close],
+        ]
+        self._run_tasks(tasks, actions)
         
         # Build summary
         summary = {
@@ -119,105 +171,131 @@ class IssueManager:
                 "issues_created": len(actions["created"]),
                 "issues_reopened": len(actions["reopened"]), 
                 "issues_closed": len(actions["closed"]),
-                "issues_unchanged": len(actions["unchanged"]),
+                "issues_unchanged": unchanged,
                 "errors": len(actions["errors"])
             }
         }
         
         return summary
     
-    def _create_new_issue(self, finding: TfSecFinding, actions: Dict[str, List]) -> None:
+    def _run_tasks(self, tasks: List[Tuple[Callable[..., Tuple[str, Dict[str, Any]]], tuple]],
+                   actions: Dict[str, List]) -> None:
+        """Run (method, args) tasks, recording each returned (action, entry) in actions
+        
+        GitHub calls run on up to max_workers threads so their latency overlaps;
+        entries are recorded in task order regardless of completion order.
+        """
+        if self.dry_run or self.max_workers <= 1 or len(tasks) <= 1:
+            results = [method(*args) for method, args in tasks]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(tasks))) as executor:
+                results = list(executor.map(lambda task: task[0](*task[1]), tasks))
+        
+        for action, entry in results:
+            actions[action].append(entry)
+    
+    def _create_new_issue(self, finding: TfSecFinding) -> Tuple[str, Dict[str, Any]]:
         """Create a new GitHub issue for a finding"""
         try:
             issue_body = IssueFormatter.format_issue_body(finding)
             
             if self.dry_run:
-                actions["created"].append({
+                return "created", {
                     "unique_id": finding.unique_id,
                     "title": finding.issue_title,
                     "severity": finding.severity,
                     "dry_run": True
-                })
-            else:
-                new_issue = self.github.create_issue_from_finding(finding, issue_body)
-                actions["created"].append({
-                    "unique_id": finding.unique_id,
-                    "issue_number": new_issue.number,
-                    "title": new_issue.title,
-                    "severity": finding.severity,
-                    "url": f"{self.github.web_base_url}/{self.github.repo_owner}/{self.github.repo_name}/issues/{new_issue.number}"
-                })
+                }
+            
+            new_issue = self.github.create_issue_from_finding(finding, issue_body)
+            return "created", {
+                "unique_id": finding.unique_id,
+                "issue_number": new_issue.number,
+                "title": new_issue.title,
+                "severity": finding.severity,
+                "url": self._issue_url_prefix + str(new_issue.number)
+            }
                 
         except Exception as e:
-            actions["errors"].append({
+            return "errors", {
                 "action": "create",
                 "unique_id": finding.unique_id,
                 "error": str(e)
-            })
+            }
     
-    def _reopen_issue(self, issue: GitHubIssue, actions: Dict[str, List]) -> None:
+    def _reopen_issue(self, issue: GitHubIssue, unique_id: Optional[str] = None) -> Tuple[str, Dict[str, Any]]:
         """Reopen a closed issue that has reappeared"""
+        if unique_id is None:
+            unique_id = issue.extract_unique_id()
+        
         try:
-            comment = IssueFormatter.format_reopen_comment(self.scan_date)
-            
             if self.dry_run:
-                actions["reopened"].append({
-                    "unique_id": issue.extract_unique_id(),
+                return "reopened", {
+                    "unique_id": unique_id,
                     "issue_number": issue.number,
                     "title": issue.title,
                     "dry_run": True
-                })
-            else:
-                reopened_issue = self.github.reopen_issue_with_comment(issue.number, comment)
-                actions["reopened"].append({
-                    "unique_id": issue.extract_unique_id(),
-                    "issue_number": reopened_issue.number,
-                    "title": reopened_issue.title,
-                    "url": f"{self.github.web_base_url}/{self.github.repo_owner}/{self.github.repo_name}/issues/{reopened_issue.number}"
-                })
+                }
+            
+            reopened_issue = self.github.reopen_issue_with_comment(issue.number, self._reopen_comment, node_id=self._node_id(issue))
+            return "reopened", {
+                "unique_id": unique_id,
+                "issue_number": reopened_issue.number,
+                "title": reopened_issue.title,
+                "url": self._issue_url_prefix + str(reopened_issue.number)
+            }
                 
         except Exception as e:
-            actions["errors"].append({
+            return "errors", {
                 "action": "reopen", 
                 "issue_number": issue.number,
                 "error": str(e)
-            })
+            }
     
-    def _close_resolved_issues(self, findings_by_id: Dict[str, TfSecFinding],
-                              existing_by_id: Dict[str, GitHubIssue], 
-                              actions: Dict[str, List]) -> None:
-        """Close issues for findings that no longer exist"""
+    def _resolved_issues(self, findings_by_id: Dict[str, TfSecFinding],
+                         existing_by_id: Dict[str, GitHubIssue]) -> List[Tuple[GitHubIssue, str]]:
+        """Open issues whose findings no longer exist, as (issue, unique_id) pairs"""
+        # Skip issues that are already closed
+        return [(issue, unique_id) for unique_id in self._resolved_ids(findings_by_id, existing_by_id)
+                if (issue := existing_by_id[unique_id]).state != "closed"]
+    
+    @staticmethod
+    def _resolved_ids(findings_by_id: Dict[str, TfSecFinding], existing_by_id: Dict[str, Any]) -> List[str]:
+        """Unique IDs tracked on GitHub that are missing from the scan
         
-        for unique_id, issue in existing_by_id.items():
-            # Skip if finding still exists or issue is already closed
-            if unique_id in findings_by_id or issue.state == "closed":
-                continue
+        Sorted so the report order doesn't depend on set or index order.
+        """
+        return sorted(existing_by_id.keys() - findings_by_id.keys())
+    
+    def _node_id(self, issue: GitHubIssue) -> Optional[str]:
+        """GraphQL node ID for close/reopen mutations, or None to use REST"""
+        return issue.node_id if self.use_graphql else None
+    
+    def _close_issue(self, issue: GitHubIssue, unique_id: str) -> Tuple[str, Dict[str, Any]]:
+        """Close an issue whose finding no longer exists"""
+        try:
+            if self.dry_run:
+                return "closed", {
+                    "unique_id": unique_id,
+                    "issue_number": issue.number,
+                    "title": issue.title,
+                    "dry_run": True
+                }
             
-            try:
-                comment = IssueFormatter.format_close_comment(self.scan_date)
+            closed_issue = self.github.close_issue_with_comment(issue.number, self._close_comment, node_id=self._node_id(issue))
+            return "closed", {
+                "unique_id": unique_id,
+                "issue_number": closed_issue.number,
+                "title": closed_issue.title,
+                "url": self._issue_url_prefix + str(closed_issue.number)
+            }
                 
-                if self.dry_run:
-                    actions["closed"].append({
-                        "unique_id": unique_id,
-                        "issue_number": issue.number,
-                        "title": issue.title,
-                        "dry_run": True
-                    })
-                else:
-                    closed_issue = self.github.close_issue_with_comment(issue.number, comment)
-                    actions["closed"].append({
-                        "unique_id": unique_id,
-                        "issue_number": closed_issue.number,
-                        "title": closed_issue.title,
-                        "url": f"{self.github.web_base_url}/{self.github.repo_owner}/{self.github.repo_name}/issues/{closed_issue.number}"
-                    })
-                    
-            except Exception as e:
-                actions["errors"].append({
-                    "action": "close",
-                    "issue_number": issue.number, 
-                    "error": str(e)
-                })
+        except Exception as e:
+            return "errors", {
+                "action": "close",
+                "issue_number": issue.number, 
+                "error": str(e)
+            }
     
     def test_github_connection(self) -> bool:
         """Test if we can connect to GitHub"""
@@ -226,8 +304,7 @@ class IssueManager:
     def get_scan_summary(self, tfsec_file_path: str) -> str:
         """Generate a markdown summary of scan results"""
         try:
-            findings = TfSecParser.parse_file(tfsec_file_path)
-            stats = TfSecParser.validate_findings(findings)
+            findings, stats = TfSecParser.parse_file(tfsec_file_path, collect_stats=True)
             return IssueFormatter.format_summary_comment(stats, self.scan_date)
         except Exception as e:
             return f"Error generating scan summary: {e}"
@@ -256,13 +333,7 @@ class IssueManager:
         
         # Create maps for efficient lookups
         findings_by_id = {f.unique_id: f for f in findings}
-        existing_by_id = {}
-        
-        # Map existing advisories by unique ID
-        for advisory in existing_advisories:
-            unique_id = self.github._extract_advisory_unique_id(advisory)
-            if unique_id:
-                existing_by_id[unique_id] = advisory
+        existing_by_id = self.github.build_advisory_index(existing_advisories)
         
         # Track actions taken
         actions = {
@@ -273,9 +344,10 @@ class IssueManager:
             "errors": []
         }
         
-        # Process current findings
-        for finding in findings:
-            unique_id = finding.unique_id
+        unchanged = 0
+        
+        # Process current findings (each unique ID once)
+        for unique_id, finding in findings_by_id.items():
             existing_advisory = existing_by_id.get(unique_id)
             
             if existing_advisory is None:
@@ -286,11 +358,13 @@ class IssueManager:
                 self._reopen_advisory(existing_advisory, actions)
             else:
                 # Advisory already exists and is open - leave it
-                actions["unchanged"].append({
-                    "unique_id": unique_id,
-                    "ghsa_id": existing_advisory.get("ghsa_id"),
-                    "title": existing_advisory.get("summary", "")
-                })
+                unchanged += 1
+                if self.verbose_actions:
+                    actions["unchanged"].append({
+                        "unique_id": unique_id,
+                        "ghsa_id": existing_advisory.get("ghsa_id"),
+                        "title": existing_advisory.get("summary", "")
+                    })
         
         # Auto-close resolved advisories if enabled
         if self.auto_close:
@@ -307,7 +381,7 @@ class IssueManager:
                 "advisories_created": len(actions["created"]),
                 "advisories_reopened": len(actions["reopened"]), 
                 "advisories_closed": len(actions["closed"]),
-                "advisories_unchanged": len(actions["unchanged"]),
+                "advisories_unchanged": unchanged,
                 "errors": len(actions["errors"])
             },
             "mode": "security_advisories"
@@ -379,9 +453,10 @@ class IssueManager:
                                   actions: Dict[str, List]) -> None:
         """Close Security Advisories for findings that no longer exist"""
         
-        for unique_id, advisory in existing_by_id.items():
-            # Skip if finding still exists or advisory is already closed
-            if unique_id in findings_by_id or advisory.get("state") == "closed":
+        for unique_id in self._resolved_ids(findings_by_id, existing_by_id):
+            advisory = existing_by_id[unique_id]
+            # Skip if advisory is already closed
+            if advisory.get("state") == "closed":
                 continue
             
             try:
@@ -1,13 +1,24 @@
 """
 Data models for TfSec findings and GitHub issues
 """
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, List, Optional
+import operator
 import os
+import sys
 from datetime import datetime
 
 
-@dataclass
+_get_label_name = operator.itemgetter("name")
+
+# Use __slots__ for models created in bulk where supported (Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Whether backslashes also separate path components (Windows)
+_BACKSLASH_PATHS = os.sep == "\\"
+
+
+@dataclass(**_SLOTS)
 class Location:
     """Represents the location of a security finding in a file"""
     filename: str
@@ -17,7 +28,12 @@ class Location:
     @property
     def file_basename(self) -> str:
         """Return just the filename without the full path"""
-        return os.path.basename(self.filename)
+        # Equivalent to os.path.basename for tfsec's paths, without its overhead
+        filename = self.filename
+        cut = filename.rfind("/")
+        if _BACKSLASH_PATHS:
+            cut = max(cut, filename.rfind("\\"))
+        return filename[cut + 1:]
 
     @property
     def line_range_str(self) -> str:
@@ -27,7 +43,7 @@ class Location:
         return f"{self.start_line}-{self.end_line}"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TfSecFinding:
     """Represents a security finding from TfSec"""
     rule_id: str
@@ -87,16 +103,50 @@ class TfSecFinding:
         return labels
 
 
-@dataclass
+# Marks a lazily computed value that has not been computed yet
+_UNSET: Any = object()
+
+
+@dataclass(**_SLOTS)
 class GitHubIssue:
     """Represents a GitHub issue"""
     number: int
     title: str
     state: str  # 'open' or 'closed'
-    labels: List[str]
+    labels: FrozenSet[str]  # unordered; a set so label checks are O(1)
     created_at: str
     updated_at: str
     body: str
+    node_id: Optional[str] = None  # GraphQL global ID
+    _unique_id: Optional[str] = field(default=_UNSET, init=False, repr=False, compare=False)
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "GitHubIssue":
+        """Build a GitHubIssue from a REST API issue payload"""
+        return cls(
+            number=data.get("number", 0),
+            title=data.get("title", ""),
+            state=data.get("state", ""),
+            labels=frozenset(map(_get_label_name, data.get("labels") or ())),
+            created_at=data.get("created_at", ""),
+            updated_at=data.get("updated_at", ""),
+            body=data.get("body") or "",
+            node_id=data.get("node_id")
+        )
+
+    @classmethod
+    def from_graphql(cls, node: Dict[str, Any]) -> "GitHubIssue":
+        """Build a GitHubIssue from a GraphQL Issue node"""
+        return cls(
+            number=node.get("number", 0),
+            title=node.get("title", ""),
+            state=(node.get("state") or "").lower(),
+            labels=frozenset(label["name"] for label in (node.get("labels") or {}).get("nodes") or () if label),
+            created_at=node.get("createdAt", ""),
+            updated_at=node.get("updatedAt", ""),
+            body=node.get("body") or "",
+            node_id=node.get("id")
+        )
 
     @property
     def is_tfsec_issue(self) -> bool:
@@ -104,38 +154,39 @@ class GitHubIssue:
         return "tfsec-security" in self.labels
 
     def extract_unique_id(self) -> Optional[str]:
-        """Extract the unique ID from the issue title if it's a tfsec issue"""
-        if not self.is_tfsec_issue:
+        """Extract the unique ID from the issue title if it's a tfsec issue
+        
+        The title is only parsed on the first call; later calls return the cached result.
+        """
+        unique_id = self._unique_id
+        if unique_id is _UNSET:
+            unique_id = self._unique_id = self._parse_unique_id()
+        return unique_id
+
+    def _parse_unique_id(self) -> Optional[str]:
+        """Parse the unique ID out of the issue title"""
+        # Same test as is_tfsec_issue, inlined to skip the property call
+        if "tfsec-security" not in self.labels:
             return None
         
         # Extract unique ID pattern from title
         # Formats: 
         # "[prefix] Rule description - resource[rule_id]"
         # "Rule description - resource[rule_id]"
-        
         title = self.title
+        prefix = None
         
         # Handle prefixed titles
         if title.startswith("[") and "] " in title:
-            # Extract prefix and rest of title
             prefix_end = title.find("] ")
             prefix = title[1:prefix_end]
-            rest_title = title[prefix_end + 2:]
-            
-            # Extract resource[rule_id] from the rest
-            if " - " in rest_title:
-                parts = rest_title.split(" - ")
-                if len(parts) >= 2:
-                    resource_rule = parts[-1]
-                    if "[" in resource_rule and resource_rule.endswith("]"):
-                        return f"{prefix}:{resource_rule}"
-        else:
-            # Handle non-prefixed titles
-            if " - " in title:
-                parts = title.split(" - ")
-                if len(parts) >= 2:
-                    potential_id = parts[-1]
-                    if "[" in potential_id and potential_id.endswith("]"):
-                        return potential_id
+            title = title[prefix_end + 2:]
+        
+        # The unique ID is whatever follows the last " - "
+        _, sep, resource_rule = title.rpartition(" - ")
+        if not sep or "[" not in resource_rule or not resource_rule.endswith("]"):
+            return None
         
-        return None
+        if prefix is not None:
+            return f"{prefix}:{resource_rule}"
+        return resource_rule
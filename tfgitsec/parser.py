@@ -1,10 +1,42 @@
 """
 TfSec JSON parser
 """
-import json
-from typing import List, Dict, Any
+import os
+import sys
+from collections import Counter
+from operator import itemgetter
+from typing import List, Dict, Any, Iterable, Iterator, BinaryIO, Tuple, Union
 from .models import TfSecFinding, Location
 
+try:
+    import orjson as _json
+except ImportError:  # orjson is an optional speedup
+    import json as _json
+
+try:
+    import ijson as _ijson
+except ImportError:  # ijson is optional; large reports are then loaded whole
+    _ijson = None
+
+# Errors raised for malformed JSON by whichever decoder is in use
+_JSON_ERRORS = (_json.JSONDecodeError,) if _ijson is None else (_json.JSONDecodeError, _ijson.JSONError)
+
+# Reports at least this large are streamed with ijson when it is installed;
+# smaller ones decode faster in one go
+_STREAM_THRESHOLD = 32 * 1024 * 1024
+
+# Fields every finding must have, fetched in one call per finding
+_REQUIRED_FIELDS = (
+    'rule_id', 'long_id', 'rule_description', 'rule_provider',
+    'rule_service', 'impact', 'resolution', 'links', 'description',
+    'severity', 'warning', 'status', 'resource', 'location'
+)
+_get_required_fields = itemgetter(*_REQUIRED_FIELDS)
+_get_location_fields = itemgetter('filename', 'start_line', 'end_line')
+
+# Returned by next() when a streamed 'results' list yielded nothing
+_NO_RESULTS = object()
+
 
 class TfSecParseError(Exception):
     """Raised when there's an error parsing tfsec JSON"""
@@ -15,24 +47,41 @@ class TfSecParser:
     """Parser for TfSec JSON output"""
     
     @staticmethod
-    def parse_file(file_path: str, prefix: str = None) -> List[TfSecFinding]:
-        """Parse tfsec findings from a JSON file"""
+    def parse_file(file_path: str, prefix: str = None,
+                   collect_stats: bool = False) -> Union[List[TfSecFinding], Tuple[List[TfSecFinding], Dict[str, Any]]]:
+        """Parse tfsec findings from a JSON file
+        
+        Large reports are parsed one finding at a time when ijson is installed,
+        so memory use does not grow with the size of the file.
+        
+        Args:
+            file_path: Path to the tfsec JSON report
+            prefix: Optional prefix for issue titles and unique IDs
+            collect_stats: If True, return (findings, stats), counting the
+                statistics of validate_findings() during the same pass
+        """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            return TfSecParser.parse_json(data, prefix)
+            # Both decoders accept UTF-8 bytes, so skip the text decoding layer
+            with open(file_path, 'rb') as f:
+                if _ijson is not None and os.fstat(f.fileno()).st_size >= _STREAM_THRESHOLD:
+                    return TfSecParser._parse_results(TfSecParser._stream_results(f), prefix, collect_stats)
+                data = _json.loads(f.read())
+            return TfSecParser.parse_json(data, prefix, collect_stats)
         except FileNotFoundError:
             raise TfSecParseError(f"TfSec JSON file not found: {file_path}")
-        except json.JSONDecodeError as e:
+        except _JSON_ERRORS as e:
             raise TfSecParseError(f"Invalid JSON in tfsec file: {e}")
-        except Exception as e:
+        except (OSError, UnicodeDecodeError) as e:
+            # e.g. a directory, no read permission, or non-UTF-8 bytes with the stdlib decoder
             raise TfSecParseError(f"Error reading tfsec file: {e}")
     
     @staticmethod
-    def parse_json(data: Dict[str, Any], prefix: str = None) -> List[TfSecFinding]:
-        """Parse tfsec findings from JSON data"""
-        findings = []
+    def parse_json(data: Dict[str, Any], prefix: str = None,
+                   collect_stats: bool = False) -> Union[List[TfSecFinding], Tuple[List[TfSecFinding], Dict[str, Any]]]:
+        """Parse tfsec findings from JSON data
         
+        With collect_stats=True, returns (findings, stats) as for parse_file().
+        """
         if not isinstance(data, dict):
             raise TfSecParseError("TfSec JSON must be a dictionary")
         
@@ -40,64 +89,114 @@ class TfSecParser:
         if not isinstance(results, list):
             raise TfSecParseError("TfSec 'results' field must be a list")
         
+        return TfSecParser._parse_results(results, prefix, collect_stats)
+    
+    @staticmethod
+    def _parse_results(results: Iterable[Dict[str, Any]], prefix: str = None,
+                       collect_stats: bool = False) -> Union[List[TfSecFinding], Tuple[List[TfSecFinding], Dict[str, Any]]]:
+        """Parse each entry of the tfsec 'results' list, optionally counting stats as it goes"""
+        findings = []
+        by_severity = Counter()
+        by_service = Counter()
+        warnings = 0
+        
         for i, result in enumerate(results):
             try:
                 finding = TfSecParser._parse_single_finding(result, prefix)
                 findings.append(finding)
-            except Exception as e:
+            except (KeyError, ValueError, TypeError, OverflowError) as e:
+                # ValueError for missing or malformed fields, TypeError for wrong JSON types,
+                # OverflowError for out-of-range numbers (e.g. an infinite line number)
                 raise TfSecParseError(f"Error parsing finding #{i}: {e}")
+            
+            if collect_stats:
+                by_severity[finding.severity] += 1
+                by_service[finding.rule_service] += 1
+                warnings += finding.warning
+        
+        if not collect_stats:
+            return findings
+        return findings, TfSecParser._build_stats(len(findings), by_severity, by_service, warnings)
+    
+    @staticmethod
+    def _stream_results(f: BinaryIO) -> Iterator[Dict[str, Any]]:
+        """Yield the entries of the 'results' list one at a time with ijson
+        
+        Only the top-level dictionary is checked up front; checking the type of
+        'results' means walking every parse event in Python, so it is only done
+        when no findings were yielded (a 'results' value that is missing or not
+        a list yields none).
+        """
+        if f.read(64).lstrip()[:1] != b'{':
+            raise TfSecParseError("TfSec JSON must be a dictionary")
+        f.seek(0)
         
-        return findings
+        results = _ijson.items(f, 'results.item')
+        first = next(results, _NO_RESULTS)
+        if first is _NO_RESULTS:
+            f.seek(0)
+            TfSecParser._check_results_array(f)
+            return
+        yield first
+        yield from results
+    
+    @staticmethod
+    def _check_results_array(f: BinaryIO) -> None:
+        """Raise TfSecParseError unless the top-level 'results' value is a list"""
+        events = _ijson.parse(f)
+        for prefix, event, value in events:
+            if prefix == '' and event == 'map_key' and value == 'results':
+                if next(events)[1] != 'start_array':
+                    raise TfSecParseError("TfSec 'results' field must be a list")
+                return
+        # Streamed reports are large; one without any results is not a tfsec report
+        raise TfSecParseError("TfSec JSON has no 'results' list")
     
     @staticmethod
     def _parse_single_finding(result: Dict[str, Any], prefix: str = None) -> TfSecFinding:
         """Parse a single tfsec finding from JSON"""
-        required_fields = [
-            'rule_id', 'long_id', 'rule_description', 'rule_provider',
-            'rule_service', 'impact', 'resolution', 'links', 'description',
-            'severity', 'warning', 'status', 'resource', 'location'
-        ]
-        
-        for field in required_fields:
-            if field not in result:
-                raise ValueError(f"Missing required field: {field}")
+        # A missing key raises KeyError naming the first missing field
+        try:
+            (rule_id, long_id, rule_description, rule_provider, rule_service, impact, resolution,
+             links, description, severity, warning, status, resource, location_data) = _get_required_fields(result)
+        except KeyError as e:
+            raise ValueError(f"Missing required field: {e.args[0]}") from None
         
         # Parse location
-        location_data = result['location']
         if not isinstance(location_data, dict):
             raise ValueError("Location must be a dictionary")
         
-        location_required = ['filename', 'start_line', 'end_line']
-        for field in location_required:
-            if field not in location_data:
-                raise ValueError(f"Missing required location field: {field}")
+        try:
+            filename, start_line, end_line = _get_location_fields(location_data)
+        except KeyError as e:
+            raise ValueError(f"Missing required location field: {e.args[0]}") from None
         
         location = Location(
-            filename=location_data['filename'],
-            start_line=int(location_data['start_line']),
-            end_line=int(location_data['end_line'])
+            filename=filename,
+            start_line=int(start_line),
+            end_line=int(end_line)
         )
         
         # Validate and convert data types
-        links = result['links']
         if not isinstance(links, list):
             raise ValueError("Links must be a list")
         
-        # Create the finding
+        # Create the finding. Rule IDs, providers, services and severities repeat
+        # across findings, so intern them to share one string per value.
         finding = TfSecFinding(
-            rule_id=str(result['rule_id']),
-            long_id=str(result['long_id']),
-            rule_description=str(result['rule_description']),
-            rule_provider=str(result['rule_provider']),
-            rule_service=str(result['rule_service']),
-            impact=str(result['impact']),
-            resolution=str(result['resolution']),
+            rule_id=sys.intern(str(rule_id)),
+            long_id=str(long_id),
+            rule_description=str(rule_description),
+            rule_provider=sys.intern(str(rule_provider)),
+            rule_service=sys.intern(str(rule_service)),
+            impact=str(impact),
+            resolution=str(resolution),
             links=[str(link) for link in links],
-            description=str(result['description']),
-            severity=str(result['severity']).upper(),
-            warning=bool(result['warning']),
-            status=int(result['status']),
-            resource=str(result['resource']),
+            description=str(description),
+            severity=sys.intern(str(severity).upper()),
+            warning=bool(warning),
+            status=int(status),
+            resource=str(resource),
             location=location,
             prefix=prefix
         )
@@ -106,29 +205,29 @@ class TfSecParser:
     
     @staticmethod
     def validate_findings(findings: List[TfSecFinding]) -> Dict[str, Any]:
-        """Validate parsed findings and return statistics"""
-        if not findings:
-            return {
-                "total": 0,
-                "by_severity": {},
-                "by_service": {},
-                "warnings": 0
-            }
-        
-        stats = {
-            "total": len(findings),
-            "by_severity": {},
-            "by_service": {},
-            "warnings": sum(1 for f in findings if f.warning)
-        }
+        """Validate parsed findings and return statistics
         
+        When parsing a report anyway, parse_file(..., collect_stats=True)
+        produces the same statistics without a second pass.
+        """
+        by_severity = Counter()
+        by_service = Counter()
+        warnings = 0
+        
+        # Single pass over the findings for all counters
         for finding in findings:
-            # Count by severity
-            severity = finding.severity
-            stats["by_severity"][severity] = stats["by_severity"].get(severity, 0) + 1
-            
-            # Count by service
-            service = finding.rule_service
-            stats["by_service"][service] = stats["by_service"].get(service, 0) + 1
+            by_severity[finding.severity] += 1
+            by_service[finding.rule_service] += 1
+            warnings += finding.warning
         
-        return stats
+        return TfSecParser._build_stats(len(findings), by_severity, by_service, warnings)
+    
+    @staticmethod
+    def _build_stats(total: int, by_severity: Counter, by_service: Counter, warnings: int) -> Dict[str, Any]:
+        """Assemble the statistics dict returned by validate_findings()"""
+        return {
+            "total": total,
+            "by_severity": dict(by_severity),
+            "by_service": dict(by_service),
+            "warnings": warnings
+        }